@@ -5,21 +5,53 @@ Backend para gerenciar chamados/tickets de missão no estuário do Rio Poxim.
 Fornece autenticação HTTP Basic, CRUD completo e documentação Swagger em /apidocs.
 
 Endpoints:
-    GET    /chamados       — Lista todos os chamados
+    GET    /chamados       — Lista todos os chamados (?status= filtra)
     GET    /chamados/<id>  — Detalhe de um chamado
     POST   /chamados       — Criar novo chamado
     PUT    /chamados/<id>  — Atualizar chamado (status, dados ecotoxicológicos)
     DELETE /chamados/<id>  — Remover chamado
+    POST   /chamados/batch — Atualizar vários chamados em uma requisição
     GET    /apidocs        — Interface Swagger UI
+
+Execução:
+    Com uvicorn e a2wsgi instalados, `python app.py` serve a aplicação
+    via ASGI (event loop); sem eles, cai no servidor de desenvolvimento
+    do Werkzeug. Os chamados vivem em memória, então o servidor roda
+    sempre com um único processo.
 """
 
+import hashlib
+import hmac
+import os
+from dataclasses import dataclass
 from functools import wraps
 from typing import Any
 
-from flask import Flask, jsonify, request, Response
+import msgspec
+import orjson
+from flask import Flask, request, Response
+from flask.json.provider import JSONProvider
 from flasgger import Swagger
 
+
+class OrJSONProvider(JSONProvider):
+    """Provider JSON do Flask apoiado em orjson (jsonify, get_json, Swagger)."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrJSONProvider(app)
+
+try:
+    from a2wsgi import WSGIMiddleware
+    asgi_app = WSGIMiddleware(app)
+except ImportError:
+    asgi_app = None
 
 swagger_config = {
     "headers": [],
@@ -65,13 +97,100 @@ Swagger(app, config=swagger_config, template=swagger_template)
 # Dados em memória
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True)
+class Chamado:
+    """Registro de um chamado; orjson o serializa direto como objeto JSON."""
+
+    id: int
+    titulo: str
+    descricao: str
+    status: str
+    coordenadas: dict[str, int]
+    dados_ecotoxicologicos: dict[str, Any] | None = None
+
+
+class Coordenadas(msgspec.Struct):
+    """Posição {x, y} do chamado no grid do estuário."""
+
+    x: int
+    y: int
+
+
+class ChamadoEntrada(msgspec.Struct):
+    """Corpo do POST /chamados, decodificado e validado em uma passada."""
+
+    titulo: str
+    descricao: str = ""
+    status: str = "aberto"
+    coordenadas: Coordenadas = msgspec.field(default_factory=lambda: Coordenadas(0, 0))
+
+
 USUARIOS: dict[str, str] = {"admin": "123456"}
 
-chamados: list[dict[str, Any]] = []
+# Credenciais já codificadas, comparadas em tempo constante na autenticação.
+USUARIOS_BYTES: dict[bytes, bytes] = {
+    usuario.encode(): senha.encode() for usuario, senha in USUARIOS.items()
+}
+
+# Chamados indexados por id (GET/PUT/DELETE em O(1)); o dict preserva a
+# ordem de criação, usada na listagem.
+chamados_por_id: dict[int, Chamado] = {}
+
+# Listagens serializadas (corpo, ETag) por filtro de status (None = todos),
+# refeitas só após POST/PUT/DELETE. Só os filtros conhecidos entram no
+# cache: um `?status=` arbitrário é serializado sem ser guardado.
+_listas_serializadas: dict[str | None, tuple[bytes, str]] = {}
+FILTROS_EM_CACHE: frozenset[str | None] = frozenset(
+    {None, "aberto", "em_andamento", "fechado"}
+)
+
+# Campos que o PUT pode alterar.
+CAMPOS_ATUALIZAVEIS: tuple[str, ...] = (
+    "status", "titulo", "descricao", "coordenadas", "dados_ecotoxicologicos",
+)
 
 proximo_id: int = 1
 
 
+# ---------------------------------------------------------------------------
+# Serialização
+# ---------------------------------------------------------------------------
+
+def _json(obj: Any, status: int = 200) -> Response:
+    """Resposta JSON serializada com orjson (bytes direto, sem json da stdlib)."""
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
+
+def _invalidar_lista() -> None:
+    """Descarta as listagens em cache após qualquer alteração nos chamados."""
+    _listas_serializadas.clear()
+
+
+def _erro_chamado_entrada(corpo: bytes, erro: msgspec.ValidationError) -> str:
+    """
+    Mensagem de erro de um corpo de POST /chamados que é JSON válido mas não
+    passou em `ChamadoEntrada`. Só neste caminho o corpo é relido sem tipo,
+    para checar título e coordenadas campo a campo.
+    """
+    dados = msgspec.json.decode(corpo)
+    if not isinstance(dados, dict) or "titulo" not in dados:
+        return "Campo 'titulo' é obrigatório"
+    if "coordenadas" in dados:
+        try:
+            msgspec.convert(dados["coordenadas"], Coordenadas)
+        except msgspec.ValidationError:
+            return "Coordenadas devem ter formato {'x': int, 'y': int}"
+    return f"Dados inválidos: {erro}"
+
+
+def _corpo_json() -> Any:
+    """Decodifica o corpo da requisição direto com orjson; None se inválido."""
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Autenticação
 # ---------------------------------------------------------------------------
@@ -81,7 +200,10 @@ def autenticar(f):
     @wraps(f)
     def decorador(*args, **kwargs):
         auth = request.authorization
-        if not auth or USUARIOS.get(auth.username) != auth.password:
+        senha = None
+        if auth and auth.username is not None and auth.password is not None:
+            senha = USUARIOS_BYTES.get(auth.username.encode())
+        if senha is None or not hmac.compare_digest(senha, auth.password.encode()):
             return Response(
                 "Acesso não autorizado. Credenciais inválidas.",
                 401,
@@ -105,6 +227,13 @@ def listar_chamados():
       - Chamados
     security:
       - basicAuth: []
+    parameters:
+      - in: query
+        name: status
+        type: string
+        required: false
+        enum: [aberto, em_andamento, fechado]
+        description: Retorna apenas chamados com este status
     responses:
       200:
         description: Lista de chamados
@@ -140,7 +269,22 @@ def listar_chamados():
           dados_ecotoxicologicos:
             type: object
     """
-    return jsonify(chamados), 200
+    status = request.args.get("status")
+    serializada = _listas_serializadas.get(status)
+    if serializada is None:
+        if status is None:
+            selecionados = list(chamados_por_id.values())
+        else:
+            selecionados = [c for c in chamados_por_id.values() if c.status == status]
+        corpo = orjson.dumps(selecionados)
+        serializada = (corpo, hashlib.blake2b(corpo, digest_size=8).hexdigest())
+        if status in FILTROS_EM_CACHE:
+            _listas_serializadas[status] = serializada
+
+    corpo, etag = serializada
+    resposta = Response(corpo, status=200, mimetype="application/json")
+    resposta.set_etag(etag, weak=True)
+    return resposta.make_conditional(request)
 
 
 @app.route("/chamados/<int:chamado_id>", methods=["GET"])
@@ -167,10 +311,10 @@ def obter_chamado(chamado_id: int):
       404:
         description: Chamado não encontrado
     """
-    for chamado in chamados:
-        if chamado["id"] == chamado_id:
-            return jsonify(chamado), 200
-    return jsonify({"erro": "Chamado não encontrado"}), 404
+    chamado = chamados_por_id.get(chamado_id)
+    if chamado is None:
+        return _json({"erro": "Chamado não encontrado"}, 404)
+    return _json(chamado, 200)
 
 
 @app.route("/chamados", methods=["POST"])
@@ -222,28 +366,27 @@ def criar_chamado():
         description: Dados inválidos
     """
     global proximo_id
-    dados = request.get_json()
-
-    if not dados or "titulo" not in dados:
-        return jsonify({"erro": "Campo 'titulo' é obrigatório"}), 400
-
-    coordenadas = dados.get("coordenadas", {"x": 0, "y": 0})
-    if not isinstance(coordenadas, dict) or "x" not in coordenadas or "y" not in coordenadas:
-        return jsonify({"erro": "Coordenadas devem ter formato {'x': int, 'y': int}"}), 400
-
-    novo_chamado: dict[str, Any] = {
-        "id": proximo_id,
-        "titulo": dados["titulo"],
-        "descricao": dados.get("descricao", ""),
-        "status": dados.get("status", "aberto"),
-        "coordenadas": coordenadas,
-        "dados_ecotoxicologicos": None,
-    }
-
-    chamados.append(novo_chamado)
+    corpo = request.get_data(cache=False)
+    try:
+        dados = msgspec.json.decode(corpo, type=ChamadoEntrada)
+    except msgspec.ValidationError as erro:
+        return _json({"erro": _erro_chamado_entrada(corpo, erro)}, 400)
+    except msgspec.DecodeError:
+        return _json({"erro": "Corpo da requisição não é um JSON válido"}, 400)
+
+    novo_chamado = Chamado(
+        id=proximo_id,
+        titulo=dados.titulo,
+        descricao=dados.descricao,
+        status=dados.status,
+        coordenadas={"x": dados.coordenadas.x, "y": dados.coordenadas.y},
+    )
+
+    chamados_por_id[proximo_id] = novo_chamado
+    _invalidar_lista()
     proximo_id += 1
 
-    return jsonify(novo_chamado), 201
+    return _json(novo_chamado, 201)
 
 
 @app.route("/chamados/<int:chamado_id>", methods=["PUT"])
@@ -295,25 +438,19 @@ def atualizar_chamado(chamado_id: int):
       404:
         description: Chamado não encontrado
     """
-    dados = request.get_json()
+    dados = _corpo_json()
     if not dados:
-        return jsonify({"erro": "Corpo da requisição vazio"}), 400
+        return _json({"erro": "Corpo da requisição vazio"}, 400)
 
-    for chamado in chamados:
-        if chamado["id"] == chamado_id:
-            if "status" in dados:
-                chamado["status"] = dados["status"]
-            if "titulo" in dados:
-                chamado["titulo"] = dados["titulo"]
-            if "descricao" in dados:
-                chamado["descricao"] = dados["descricao"]
-            if "coordenadas" in dados:
-                chamado["coordenadas"] = dados["coordenadas"]
-            if "dados_ecotoxicologicos" in dados:
-                chamado["dados_ecotoxicologicos"] = dados["dados_ecotoxicologicos"]
-            return jsonify(chamado), 200
+    chamado = chamados_por_id.get(chamado_id)
+    if chamado is None:
+        return _json({"erro": "Chamado não encontrado"}, 404)
 
-    return jsonify({"erro": "Chamado não encontrado"}), 404
+    for campo in CAMPOS_ATUALIZAVEIS:
+        if campo in dados:
+            setattr(chamado, campo, dados[campo])
+    _invalidar_lista()
+    return _json(chamado, 200)
 
 
 @app.route("/chamados/<int:chamado_id>", methods=["DELETE"])
@@ -338,12 +475,71 @@ def deletar_chamado(chamado_id: int):
       404:
         description: Chamado não encontrado
     """
-    for i, chamado in enumerate(chamados):
-        if chamado["id"] == chamado_id:
-            chamados.pop(i)
-            return jsonify({"mensagem": "Chamado removido com sucesso"}), 200
+    chamado = chamados_por_id.pop(chamado_id, None)
+    if chamado is None:
+        return _json({"erro": "Chamado não encontrado"}, 404)
 
-    return jsonify({"erro": "Chamado não encontrado"}), 404
+    _invalidar_lista()
+    return _json({"mensagem": "Chamado removido com sucesso"}, 200)
+
+
+@app.route("/chamados/batch", methods=["POST"])
+@autenticar
+def atualizar_chamados_em_lote():
+    """
+    Atualiza vários chamados em uma única requisição.
+    ---
+    tags:
+      - Chamados
+    security:
+      - basicAuth: []
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: array
+          items:
+            type: object
+            required:
+              - id
+            properties:
+              id:
+                type: integer
+                example: 1
+              status:
+                type: string
+                enum: [aberto, em_andamento, fechado]
+                example: fechado
+              dados_ecotoxicologicos:
+                type: object
+    responses:
+      200:
+        description: Chamados atualizados e ids não encontrados
+      400:
+        description: Corpo deve ser uma lista de objetos com 'id'
+    """
+    dados = _corpo_json()
+    if not isinstance(dados, list) or not all(
+        isinstance(item, dict) and isinstance(item.get("id"), int) for item in dados
+    ):
+        return _json({"erro": "Corpo deve ser uma lista de objetos com 'id'"}, 400)
+
+    atualizados: list[Chamado] = []
+    nao_encontrados: list[int] = []
+    for item in dados:
+        chamado = chamados_por_id.get(item["id"])
+        if chamado is None:
+            nao_encontrados.append(item["id"])
+            continue
+        for campo in CAMPOS_ATUALIZAVEIS:
+            if campo in item:
+                setattr(chamado, campo, item[campo])
+        atualizados.append(chamado)
+
+    if atualizados:
+        _invalidar_lista()
+    return _json({"atualizados": atualizados, "nao_encontrados": nao_encontrados}, 200)
 
 
 if __name__ == "__main__":
@@ -353,4 +549,26 @@ if __name__ == "__main__":
     print("  Swagger UI:  http://localhost:5000/apidocs")
     print("  Credenciais: admin / 123456")
     print("=" * 60)
-    app.run(debug=True, port=5000)
+
+    try:
+        import uvicorn
+    except ImportError:
+        uvicorn = None
+
+    if uvicorn is not None and asgi_app is not None:
+        # Um único processo: cada worker teria sua própria cópia de
+        # `chamados_por_id`, e um PUT atendido por um não apareceria nos
+        # GETs dos outros. O app vai como objeto (mesmo processo), então o
+        # modo debug do Flask vale também aqui.
+        app.debug = True
+        uvicorn.run(
+            asgi_app,
+            host="127.0.0.1",
+            port=5000,
+            workers=1,
+            log_level="debug",
+            loop="auto",
+            http="auto",
+        )
+    else:
+        app.run(debug=True, port=5000)
@@ -20,8 +20,19 @@ Nós:
 
 from __future__ import annotations
 
+import bisect
+import os
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Protocol, runtime_checkable
 
+import numpy as np
+
+_RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _RAIZ not in sys.path:
+    sys.path.insert(0, _RAIZ)
+
 # ============================================================================
 # Protocolo do ChemicalSensor (para type checking sem importação circular)
 # ============================================================================
@@ -30,7 +41,7 @@ from typing import Protocol, runtime_checkable
 class ChemicalSensor(Protocol):
     """Protocolo compatível com interfaces.sensor_interfaces.ChemicalSensor."""
 
-    def get_contamination_reading(self) -> dict[str, float]:
+    def get_contamination_reading(self) -> Mapping[str, float]:
         ...
 
 
@@ -58,102 +69,245 @@ CPT_POLUICAO_GRAVE: dict[tuple[str, str], dict[str, float]] = {
     ("boa", "não"):        {"sim": 0.05, "não": 0.95},
 }
 
-class RedeBayesianaPoluicao:
-    """
-    Rede Bayesiana para diagnóstico de poluição no estuário.
-    Implementa inferência por enumeração exata (AIMA, Fig. 13.9)
-    para calcular P(PoluiçãoGrave | evidências).
+# Posição de cada valor nos eixos do tensor conjunto
+# (mare, proximidade_urbana, saude_mangue, poluicao_grave).
+INDICE_MARE: dict[str, int] = {"baixa": 0, "alta": 1}
+INDICE_PROXIMIDADE: dict[str, int] = {"sim": 0, "não": 1}
+INDICE_SAUDE: dict[str, int] = {"boa": 0, "degradada": 1}
+INDICE_POLUICAO: dict[str, int] = {"sim": 0, "não": 1}
+
+
+def _tabela_cpt(
+    cpt: dict[tuple[str, str], dict[str, float]],
+    indices: tuple[dict[str, int], dict[str, int], dict[str, int]],
+) -> np.ndarray:
+    """Achata uma CPT com pais (pai1, pai2) em array [pai1, pai2, valor]."""
+    indice_pai1, indice_pai2, indice_valor = indices
+    tabela = np.zeros((2, 2, 2))
+    for (pai1, pai2), dist in cpt.items():
+        for valor, p in dist.items():
+            tabela[indice_pai1[pai1], indice_pai2[pai2], indice_valor[valor]] = p
+    return tabela
+
+
+# CPTs em arrays float64 contíguos, indexados pelos códigos INDICE_*.
+TABELA_MARE: np.ndarray = np.array(
+    [CPT_MARE[m] for m in sorted(INDICE_MARE, key=INDICE_MARE.get)]
+)
+TABELA_PROXIMIDADE: np.ndarray = np.array(
+    [CPT_PROXIMIDADE_URBANA[u] for u in sorted(INDICE_PROXIMIDADE, key=INDICE_PROXIMIDADE.get)]
+)
+TABELA_SAUDE: np.ndarray = _tabela_cpt(
+    CPT_SAUDE_MANGUE, (INDICE_MARE, INDICE_PROXIMIDADE, INDICE_SAUDE)
+)
+TABELA_POLUICAO: np.ndarray = _tabela_cpt(
+    CPT_POLUICAO_GRAVE, (INDICE_SAUDE, INDICE_PROXIMIDADE, INDICE_POLUICAO)
+)
+
+
+# Python puro: no máximo 27 combinações de evidências chegam aqui, cada uma
+# uma vez só (`_inferir_cached`); compilar com numba custaria mais que isso.
+def _eliminar_variaveis(
+    p_mare: np.ndarray,
+    p_prox: np.ndarray,
+    p_saude: np.ndarray,
+    pol_sim: np.ndarray,
+    pol_dado_mare_prox: np.ndarray,
+    m_idx: int,
+    u_idx: int,
+    s_idx: int,
+) -> float:
     """
+    P(PoluiçãoGrave=sim | evidências) por eliminação de variáveis.
 
-    def __init__(self) -> None:
-        self.cpt_mare = CPT_MARE
-        self.cpt_proximidade = CPT_PROXIMIDADE_URBANA
-        self.cpt_saude = CPT_SAUDE_MANGUE
-        self.cpt_poluicao = CPT_POLUICAO_GRAVE
+    SaúdeMangue é eliminada primeiro: sem evidência sobre ela, o fator
+    Σ_s P(s | m, u)·P(sim | s, u) já vem pronto em `pol_dado_mare_prox` e a
+    massa de P(s | m, u) soma 1, restando só o produto P(m)·P(u). Maré e
+    proximidade são somadas por fora. Cada índice fixa o valor observado
+    da variável; -1 indica variável oculta.
+    """
+    num = 0.0
+    den = 0.0
+    for m in range(2):
+        if m_idx >= 0 and m != m_idx:
+            continue
+        for u in range(2):
+            if u_idx >= 0 and u != u_idx:
+                continue
+            peso = p_mare[m] * p_prox[u]
+            if s_idx < 0:
+                num += peso * pol_dado_mare_prox[m, u]
+            else:
+                peso *= p_saude[m, u, s_idx]
+                num += peso * pol_sim[s_idx, u]
+            den += peso
+    if den == 0:
+        return 0.0
+    return num / den
+
+
+# P(Poluição=sim | saude, prox) é a própria CPT; P(Poluição=sim | mare, prox)
+# elimina a saúde do mangue, cuja CPT já é normalizada.
+_POL_SIM: np.ndarray = np.ascontiguousarray(TABELA_POLUICAO[:, :, INDICE_POLUICAO["sim"]])
+_POL_MARE_PROX: np.ndarray = np.einsum("mus,su->mu", TABELA_SAUDE, _POL_SIM)
+_POL_DADO_SAUDE_PROX: list[list[float]] = _POL_SIM.tolist()
+_POL_DADO_MARE_PROX: list[list[float]] = _POL_MARE_PROX.tolist()
+
+
+def _evidencias_do_codigo(codigo: int) -> dict[str, str]:
+    """Evidências para o código (OD<4)<<2 | (OD>=6)<<1 | urbano."""
+    evidencias: dict[str, str] = {}
+    if codigo & 0b100:
+        evidencias["saude_mangue"] = "degradada"
+    elif codigo & 0b010:
+        evidencias["saude_mangue"] = "boa"
+    evidencias["proximidade_urbana"] = "sim" if codigo & 0b001 else "não"
+    return evidencias
+
+
+_EVIDENCIAS_POR_CODIGO: tuple[dict[str, str], ...] = tuple(
+    _evidencias_do_codigo(codigo) for codigo in range(8)
+)
+
+
+# Registro devolvido por `converter_leituras_em_lote`: índices das
+# evidências (INDICE_PROXIMIDADE / INDICE_SAUDE), -1 = não observada.
+DTYPE_EVIDENCIAS: np.dtype = np.dtype([("proximidade", np.int8), ("saude", np.int8)])
+
+
+def _distribuicao(p_sim: float) -> dict[str, float]:
+    """Distribuição {sim, não} arredondada a partir de P(PoluiçãoGrave=sim)."""
+    return {"sim": round(p_sim, 4), "não": round(1 - p_sim, 4)}
+
+
+@lru_cache(maxsize=64)
+def _inferir_cached(mare: str | None, prox: str | None, saude: str | None) -> float:
+    """
+    P(PoluiçãoGrave=sim | evidências), memorizada por combinação de evidências.
 
-    def inferir(self, evidencias: dict[str, str]) -> float:
-        """
-        Calcula P(PoluiçãoGrave=sim | evidências) por enumeração exata.
-        """
-        mares = [evidencias["mare"]] if "mare" in evidencias else ["baixa", "alta"]
-        proximidades = (
-            [evidencias["proximidade_urbana"]]
-            if "proximidade_urbana" in evidencias
-            else ["sim", "não"]
-        )
-        saudes = (
-            [evidencias["saude_mangue"]]
-            if "saude_mangue" in evidencias
-            else ["boa", "degradada"]
-        )
+    Com saúde e proximidade observadas a resposta é a própria CPT de
+    PoluiçãoGrave (a maré fica d-separada); com maré e proximidade usa-se
+    a marginal pré-calculada; os demais casos passam por
+    `_eliminar_variaveis`.
+    """
+    if prox is not None:
+        u = INDICE_PROXIMIDADE[prox]
+        if saude is not None:
+            return _POL_DADO_SAUDE_PROX[INDICE_SAUDE[saude]][u]
+        if mare is not None:
+            return _POL_DADO_MARE_PROX[INDICE_MARE[mare]][u]
+
+    return float(_eliminar_variaveis(
+        TABELA_MARE,
+        TABELA_PROXIMIDADE,
+        TABELA_SAUDE,
+        _POL_SIM,
+        _POL_MARE_PROX,
+        INDICE_MARE[mare] if mare is not None else -1,
+        INDICE_PROXIMIDADE[prox] if prox is not None else -1,
+        INDICE_SAUDE[saude] if saude is not None else -1,
+    ))
 
-        prob_poluicao = 0.0
-        prob_total = 0.0
 
-        for mare in mares:
-            p_mare = self.cpt_mare[mare]
+class RedeBayesianaPoluicao:
+    """
+    Rede Bayesiana para diagnóstico de poluição no estuário.
+    Implementa inferência exata por eliminação de variáveis (AIMA,
+    Seção 13.4.2) para calcular P(PoluiçãoGrave | evidências).
 
-            for prox in proximidades:
-                p_prox = self.cpt_proximidade[prox]
+    As CPTs ficam em arrays no módulo; a eliminação roda em
+    `_eliminar_variaveis`, e cada combinação de evidências é calculada uma
+    vez só (`_inferir_cached`).
+    """
 
-                for saude in saudes:
-                    p_saude = self.cpt_saude[(mare, prox)][saude]
+    # Faixas de risco: prob < 0.25 → BAIXO, < 0.50 → MODERADO, < 0.75 → ALTO.
+    _LIMIARES_RISCO: tuple[float, ...] = (0.25, 0.50, 0.75)
+    _ROTULOS_RISCO: tuple[str, ...] = ("🟢 BAIXO", "🟡 MODERADO", "🟠 ALTO", "🔴 CRÍTICO")
+    _ROTULOS_RISCO_NP: np.ndarray = np.array(_ROTULOS_RISCO)
 
-                    p_pol_sim = self.cpt_poluicao[(saude, prox)]["sim"]
-                    p_pol_nao = self.cpt_poluicao[(saude, prox)]["não"]
+    __slots__ = ()
 
-                    p_conjunta_sim = p_mare * p_prox * p_saude * p_pol_sim
-                    p_conjunta_nao = p_mare * p_prox * p_saude * p_pol_nao
+    # CPTs compartilhadas por todas as instâncias.
+    cpt_mare = CPT_MARE
+    cpt_proximidade = CPT_PROXIMIDADE_URBANA
+    cpt_saude = CPT_SAUDE_MANGUE
+    cpt_poluicao = CPT_POLUICAO_GRAVE
 
-                    prob_poluicao += p_conjunta_sim
-                    prob_total += p_conjunta_sim + p_conjunta_nao
+    def inferir(self, evidencias: dict[str, str]) -> float:
+        """
+        Calcula P(PoluiçãoGrave=sim | evidências) por inferência exata.
 
-        if prob_total == 0:
-            return 0.0
-        return prob_poluicao / prob_total
+        Variáveis ausentes do dicionário são marginalizadas.
+        """
+        return _inferir_cached(
+            evidencias.get("mare"),
+            evidencias.get("proximidade_urbana"),
+            evidencias.get("saude_mangue"),
+        )
 
     def inferir_completa(
         self, evidencias: dict[str, str]
     ) -> dict[str, float]:
         """Retorna distribuição completa P(PoluiçãoGrave | evidências)."""
-        p_sim = self.inferir(evidencias)
-        return {"sim": round(p_sim, 4), "não": round(1 - p_sim, 4)}
+        return _distribuicao(self.inferir(evidencias))
 
     def classificar_risco(self, probabilidade: float) -> str:
         """Classifica o nível de risco com base na probabilidade."""
-        if probabilidade < 0.25:
-            return "🟢 BAIXO"
-        elif probabilidade < 0.50:
-            return "🟡 MODERADO"
-        elif probabilidade < 0.75:
-            return "🟠 ALTO"
-        else:
-            return "🔴 CRÍTICO"
+        return self._ROTULOS_RISCO[bisect.bisect_right(self._LIMIARES_RISCO, probabilidade)]
+
+    def classificar_risco_em_lote(self, probabilidades: np.ndarray) -> np.ndarray:
+        """Classifica um array de probabilidades (ex.: mapa de calor do estuário)."""
+        indices = np.searchsorted(self._LIMIARES_RISCO, probabilidades, side="right")
+        return self._ROTULOS_RISCO_NP[indices]
 
     def converter_leitura_sensor(
         self,
-        leitura: dict[str, float],
+        leitura: Mapping[str, float],
         posicao_urbana: bool = False,
     ) -> dict[str, str]:
         """
         Converte leitura do ChemicalSensor em evidências bayesianas.
-        """
-        evidencias: dict[str, str] = {}
 
+        As faixas de OD e o indicador urbano formam um código de 3 bits
+        que indexa `_EVIDENCIAS_POR_CODIGO`; devolve uma cópia, pois o
+        chamador pode acrescentar evidências (ex.: maré).
+        """
         od = leitura.get("OD", 6.5)
-        if od < 4.0:
-            evidencias["saude_mangue"] = "degradada"
-        elif od >= 6.0:
-            evidencias["saude_mangue"] = "boa"
+        urbano = (
+            leitura.get("mercurio", 0.0) > 0.001
+            or leitura.get("chumbo", 0.0) > 0.01
+            or posicao_urbana
+        )
+        codigo = (od < 4.0) << 2 | (od >= 6.0) << 1 | bool(urbano)
+        return dict(_EVIDENCIAS_POR_CODIGO[codigo])
 
-        mercurio = leitura.get("mercurio", 0.0)
-        chumbo = leitura.get("chumbo", 0.0)
+    def converter_leituras_em_lote(
+        self,
+        leituras: np.ndarray,
+        posicao_urbana: np.ndarray | bool = False,
+    ) -> np.ndarray:
+        """
+        Versão vetorizada de `converter_leitura_sensor` para um transecto.
 
-        if mercurio > 0.001 or chumbo > 0.01 or posicao_urbana:
-            evidencias["proximidade_urbana"] = "sim"
-        else:
-            evidencias["proximidade_urbana"] = "não"
+        Args:
+            leituras (np.ndarray): Array (N, 3) com colunas (OD, mercurio, chumbo).
+            posicao_urbana (np.ndarray | bool): Máscara (N,) ou valor único.
 
+        Returns:
+            np.ndarray: Array (N,) de `DTYPE_EVIDENCIAS`.
+        """
+        leituras = np.asarray(leituras, dtype=np.float64)
+        od = leituras[:, 0]
+        evidencias = np.empty(len(leituras), dtype=DTYPE_EVIDENCIAS)
+        evidencias["saude"] = np.where(
+            od < 4.0,
+            INDICE_SAUDE["degradada"],
+            np.where(od >= 6.0, INDICE_SAUDE["boa"], -1),
+        )
+        urbano = (leituras[:, 1] > 0.001) | (leituras[:, 2] > 0.01) | posicao_urbana
+        evidencias["proximidade"] = np.where(
+            urbano, INDICE_PROXIMIDADE["sim"], INDICE_PROXIMIDADE["não"]
+        )
         return evidencias
 
     def diagnosticar_com_sensor(
@@ -179,19 +333,20 @@ class RedeBayesianaPoluicao:
             "probabilidade_poluicao_grave": round(prob, 4),
             "classificacao_risco": classificacao,
             "evidencias_usadas": evidencias,
-            "leitura_sensor": leitura,
-            "distribuicao": self.inferir_completa(evidencias),
+            "leitura_sensor": dict(leitura),
+            "distribuicao": _distribuicao(prob),
         }
 
 
 def main() -> None:
     """Demonstração da rede bayesiana com diferentes cenários."""
+    linhas: list[str] = []
 
-    print("=" * 70)
-    print("  🧬 REDE BAYESIANA — Diagnóstico de Poluição")
-    print("  📍 Estuário do Rio Poxim, Aracaju-SE")
-    print("  📖 Referência: AIMA — Capítulos 12 e 13")
-    print("=" * 70)
+    linhas.append("=" * 70)
+    linhas.append("  🧬 REDE BAYESIANA — Diagnóstico de Poluição")
+    linhas.append("  📍 Estuário do Rio Poxim, Aracaju-SE")
+    linhas.append("  📖 Referência: AIMA — Capítulos 12 e 13")
+    linhas.append("=" * 70)
 
     rede = RedeBayesianaPoluicao()
 
@@ -223,25 +378,21 @@ def main() -> None:
     ]
 
     for cenario in cenarios:
-        print(f"\n{'─' * 70}")
-        print(f"  🔬 {cenario['nome']}")
-        print(f"  Evidências: {cenario['evidencias']}")
+        linhas.append(f"\n{'─' * 70}")
+        linhas.append(f"  🔬 {cenario['nome']}")
+        linhas.append(f"  Evidências: {cenario['evidencias']}")
 
         dist = rede.inferir_completa(cenario["evidencias"])
         prob = dist["sim"]
         risco = rede.classificar_risco(prob)
 
-        print(f"  P(PoluiçãoGrave = sim) = {prob:.4f}")
-        print(f"  P(PoluiçãoGrave = não) = {dist['não']:.4f}")
-        print(f"  Classificação: {risco}")
+        linhas.append(f"  P(PoluiçãoGrave = sim) = {prob:.4f}")
+        linhas.append(f"  P(PoluiçãoGrave = não) = {dist['não']:.4f}")
+        linhas.append(f"  Classificação: {risco}")
 
-    print(f"\n\n{'═' * 70}")
-    print("  🧪 INTEGRAÇÃO COM ChemicalSensor")
-    print(f"{'═' * 70}")
-
-    import sys
-    import os
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    linhas.append(f"\n\n{'═' * 70}")
+    linhas.append("  🧪 INTEGRAÇÃO COM ChemicalSensor")
+    linhas.append(f"{'═' * 70}")
 
     from interfaces.sensor_interfaces import SimulatedChemical
 
@@ -257,11 +408,11 @@ def main() -> None:
         posicao_urbana=False,
     )
 
-    print(f"\n  📊 Sensor: Água limpa (OD=7.0, metais baixos)")
-    print(f"  Leitura: {resultado['leitura_sensor']}")
-    print(f"  Evidências: {resultado['evidencias_usadas']}")
-    print(f"  P(Poluição Grave) = {resultado['probabilidade_poluicao_grave']:.4f}")
-    print(f"  Risco: {resultado['classificacao_risco']}")
+    linhas.append(f"\n  📊 Sensor: Água limpa (OD=7.0, metais baixos)")
+    linhas.append(f"  Leitura: {resultado['leitura_sensor']}")
+    linhas.append(f"  Evidências: {resultado['evidencias_usadas']}")
+    linhas.append(f"  P(Poluição Grave) = {resultado['probabilidade_poluicao_grave']:.4f}")
+    linhas.append(f"  Risco: {resultado['classificacao_risco']}")
 
     sensor_poluido = SimulatedChemical(default_readings={
         "mercurio": 0.05,
@@ -275,11 +426,11 @@ def main() -> None:
         posicao_urbana=True,
     )
 
-    print(f"\n  📊 Sensor: Água contaminada (OD=2.8, metais altos)")
-    print(f"  Leitura: {resultado['leitura_sensor']}")
-    print(f"  Evidências: {resultado['evidencias_usadas']}")
-    print(f"  P(Poluição Grave) = {resultado['probabilidade_poluicao_grave']:.4f}")
-    print(f"  Risco: {resultado['classificacao_risco']}")
+    linhas.append(f"\n  📊 Sensor: Água contaminada (OD=2.8, metais altos)")
+    linhas.append(f"  Leitura: {resultado['leitura_sensor']}")
+    linhas.append(f"  Evidências: {resultado['evidencias_usadas']}")
+    linhas.append(f"  P(Poluição Grave) = {resultado['probabilidade_poluicao_grave']:.4f}")
+    linhas.append(f"  Risco: {resultado['classificacao_risco']}")
 
     sensor_moderado = SimulatedChemical(default_readings={
         "mercurio": 0.01,
@@ -293,15 +444,17 @@ def main() -> None:
         posicao_urbana=False,
     )
 
-    print(f"\n  📊 Sensor: Valores moderados (OD=4.5, metais médios)")
-    print(f"  Leitura: {resultado['leitura_sensor']}")
-    print(f"  Evidências: {resultado['evidencias_usadas']}")
-    print(f"  P(Poluição Grave) = {resultado['probabilidade_poluicao_grave']:.4f}")
-    print(f"  Risco: {resultado['classificacao_risco']}")
+    linhas.append(f"\n  📊 Sensor: Valores moderados (OD=4.5, metais médios)")
+    linhas.append(f"  Leitura: {resultado['leitura_sensor']}")
+    linhas.append(f"  Evidências: {resultado['evidencias_usadas']}")
+    linhas.append(f"  P(Poluição Grave) = {resultado['probabilidade_poluicao_grave']:.4f}")
+    linhas.append(f"  Risco: {resultado['classificacao_risco']}")
+
+    linhas.append(f"\n{'═' * 70}")
+    linhas.append("  ✅ Demonstração concluída")
+    linhas.append(f"{'═' * 70}\n")
 
-    print(f"\n{'═' * 70}")
-    print("  ✅ Demonstração concluída")
-    print(f"{'═' * 70}\n")
+    sys.stdout.write("\n".join(linhas) + "\n")
 
 
 if __name__ == "__main__":
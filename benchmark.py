@@ -1,15 +1,24 @@
-import random
-import statistics
+import multiprocessing
+import os
+
+import numpy as np
+
 from problems.search_problem import PollutionMappingProblem
 
+_RNG = np.random.default_rng()
+
+# Cada missão leva dezenas de microssegundos: abaixo disto, subir o pool e
+# trocar resultados entre processos custa mais do que rodar tudo em série.
+MIN_RUNS_PARALELO: int = 10_000
 
-def run_mission(grid_size=(10, 10), n_targets=3, zonas_urbanas=None, battery_capacity=50):
+
+def run_mission(grid_size=(10, 10), n_targets=3, zonas_urbanas=None, battery_capacity=50, rng=None):
     width, height = grid_size
     zonas_urbanas = zonas_urbanas or set()
     # gerar alvos aleatórios distintos
-    targets = set()
-    while len(targets) < n_targets:
-        targets.add((random.randrange(width), random.randrange(height)))
+    rng = rng if rng is not None else _RNG
+    flat = rng.choice(width * height, size=n_targets, replace=False)
+    targets = {(int(i % width), int(i // width)) for i in flat}
 
     # inicializa problema: começa na base (0,0)
     initial = (0, 0, battery_capacity, frozenset(targets))
@@ -17,7 +26,7 @@ def run_mission(grid_size=(10, 10), n_targets=3, zonas_urbanas=None, battery_cap
 
     # Simulação simples: mover guloso até cada alvo e depois voltar
     cur_x, cur_y, bateria, alvos = initial
-    pending = set(alvos)
+    pending = list(alvos)
 
     def move_step(tx, ty):
         nonlocal cur_x, cur_y, bateria
@@ -35,12 +44,18 @@ def run_mission(grid_size=(10, 10), n_targets=3, zonas_urbanas=None, battery_cap
 
     # Visit targets
     while pending and bateria > 0:
-        # escolher alvo mais próximo
-        alvo = min(pending, key=lambda t: abs(t[0] - cur_x) + abs(t[1] - cur_y))
+        # escolher alvo mais próximo (Manhattan inline, sem lambda/abs)
+        melhor_i = 0
+        melhor_d = -1
+        for i, (t0, t1) in enumerate(pending):
+            md = (t0 - cur_x if t0 > cur_x else cur_x - t0) + (t1 - cur_y if t1 > cur_y else cur_y - t1)
+            if melhor_d < 0 or md < melhor_d:
+                melhor_i, melhor_d = i, md
+        alvo = pending[melhor_i]
         while (cur_x, cur_y) != alvo and bateria > 0:
             move_step(*alvo)
         if (cur_x, cur_y) == alvo:
-            pending.remove(alvo)
+            pending.pop(melhor_i)
 
     # Voltar para base
     while (cur_x, cur_y) != (0, 0) and bateria > 0:
@@ -50,20 +65,28 @@ def run_mission(grid_size=(10, 10), n_targets=3, zonas_urbanas=None, battery_cap
     return success, bateria
 
 
+def _worker(seed: int):
+    # semente por missão: resultados reprodutíveis independente do nº de processos
+    return run_mission(rng=np.random.default_rng(seed))
+
+
 def main(runs: int = 100):
-    results = []
-    for _ in range(runs):
-        success, remaining = run_mission()
-        results.append((success, remaining))
-
-    successes = [1 for s, _ in results if s]
-    battery_left = [r for _, r in results]
-
-    taxa_sucesso = sum(successes) / runs * 100
-    media_bateria = statistics.mean(battery_left)
-    dp_bateria = statistics.pstdev(battery_left)
-    pior = min(battery_left)
-    melhor = max(battery_left)
+    n_procs = os.cpu_count() or 1
+    if runs < MIN_RUNS_PARALELO or n_procs == 1:
+        results = [_worker(seed) for seed in range(runs)]
+    else:
+        # Um bloco contíguo de sementes por processo.
+        with multiprocessing.Pool(n_procs) as pool:
+            results = pool.map(_worker, range(runs), chunksize=-(-runs // n_procs))
+
+    successes = np.fromiter((s for s, _ in results), dtype=bool, count=runs)
+    battery_left = np.fromiter((r for _, r in results), dtype=np.int32, count=runs)
+
+    taxa_sucesso = successes.mean() * 100
+    media_bateria = battery_left.mean()
+    dp_bateria = battery_left.std()
+    pior = battery_left.min()
+    melhor = battery_left.max()
 
     print(f"Runs: {runs}")
     print(f"Taxa de sucesso: {taxa_sucesso:.2f}%")
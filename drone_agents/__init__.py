@@ -1 +1 @@
-# agents — Módulo de agentes inteligentes
+# drone_agents — Módulo de agentes inteligentes
@@ -1,5 +1,5 @@
 """
-agents/api_gateway.py — Gateway de Comunicação com a API Flask
+drone_agents/api_gateway.py — Gateway de Comunicação com a API Flask
 
 Implementa o Single Responsibility Principle (SRP):
     Esta classe é responsável EXCLUSIVAMENTE pela comunicação HTTP
@@ -12,8 +12,16 @@ Implementa o Dependency Inversion Principle (DIP):
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
 
 class APIGateway:
     """
@@ -22,19 +30,33 @@ class APIGateway:
     tratamento de erros da API Flask.
     """
 
+    __slots__ = (
+        "base_url",
+        "username",
+        "password",
+        "usar_simulacao",
+        "_session",
+        "_chamados_simulados",
+        "_chamados_por_id",
+        "_verbose",
+    )
+
     def __init__(
         self,
         base_url: str = "http://localhost:5000",
         username: str = "admin",
         password: str = "123456",
         usar_simulacao: bool = False,
+        verbose: bool = True,
     ) -> None:
         self.base_url: str = base_url
         self.username: str = username
         self.password: str = password
         self.usar_simulacao: bool = usar_simulacao
+        self._session: Any = None
+        self._verbose: bool = verbose
 
-        self._chamados_simulados: list[dict[str, Any]] = [
+        chamados: list[dict[str, Any]] = [
             {
                 "id": 1,
                 "titulo": "Amostragem Ponto Norte - Mangue Degradado",
@@ -60,30 +82,80 @@ class APIGateway:
                 "dados_ecotoxicologicos": None,
             },
         ]
+        # Índice por id com os dicts mutáveis; a leitura usa visões somente
+        # leitura sobre os mesmos dicts (ordem preservada na tupla).
+        self._chamados_por_id: dict[int, dict[str, Any]] = {
+            c["id"]: c for c in chamados
+        }
+        self._chamados_simulados: tuple[Mapping[str, Any], ...] = tuple(
+            MappingProxyType(c) for c in chamados
+        )
+
+    def _get_session(self) -> Any:
+        """
+        Sessão HTTP reutilizada entre chamadas (keep-alive via pool do
+        HTTPAdapter), criada na primeira requisição real à API.
+        """
+        if self._session is None:
+            if requests is None:
+                raise RuntimeError("pacote 'requests' não instalado")
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.auth = (self.username, self.password)
+            self._session = session
+        return self._session
+
+    def _simulados(self, copiar: bool) -> Sequence[Mapping[str, Any]]:
+        if copiar:
+            return [dict(c) for c in self._chamados_simulados]
+        return self._chamados_simulados
 
-    def get_all_chamados(self) -> list[dict[str, Any]]:
-        """Retorna todos os chamados do sistema."""
+    def get_all_chamados(self, copiar: bool = False) -> Sequence[Mapping[str, Any]]:
+        """
+        Retorna todos os chamados do sistema.
+        Com a API ativa, a lista de dicts decodificada da resposta. No modo
+        simulado, a própria tupla interna de visões somente leitura
+        (atualizadas por `update_chamado_status`), sem cópia por chamada;
+        use `copiar=True` para obter uma lista de dicts mutáveis independentes.
+        """
         if self.usar_simulacao:
-            return list(self._chamados_simulados)
+            return self._simulados(copiar)
 
         try:
-            import requests
-            response = requests.get(
+            response = self._get_session().get(
                 f"{self.base_url}/chamados",
-                auth=(self.username, self.password),
                 timeout=5,
             )
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            print(f"  ⚠️  API indisponível ({e}). Usando dados simulados.")
+            if self._verbose:
+                print(f"  ⚠️  API indisponível ({e}). Usando dados simulados.")
             self.usar_simulacao = True
-            return list(self._chamados_simulados)
+            return self._simulados(copiar)
 
-    def get_open_chamados(self) -> list[dict[str, Any]]:
-        """Retorna apenas os chamados com status 'aberto'."""
-        todos = self.get_all_chamados()
-        return [c for c in todos if c.get("status") == "aberto"]
+    def get_open_chamados(self) -> list[Mapping[str, Any]]:
+        """
+        Retorna apenas os chamados com status 'aberto'.
+        Com a API ativa o filtro é feito no servidor (?status=aberto).
+        """
+        if not self.usar_simulacao:
+            try:
+                response = self._get_session().get(
+                    f"{self.base_url}/chamados",
+                    params={"status": "aberto"},
+                    timeout=5,
+                )
+                response.raise_for_status()
+                return [c for c in response.json() if c.get("status") == "aberto"]
+            except Exception as e:
+                if self._verbose:
+                    print(f"  ⚠️  API indisponível ({e}). Usando dados simulados.")
+                self.usar_simulacao = True
+
+        return [c for c in self._chamados_simulados if c.get("status") == "aberto"]
 
     def update_chamado_status(
         self,
@@ -100,37 +172,81 @@ class APIGateway:
             payload["dados_ecotoxicologicos"] = dados_extras
 
         if self.usar_simulacao:
-            for chamado in self._chamados_simulados:
-                if chamado["id"] == chamado_id:
-                    chamado["status"] = novo_status
-                    if dados_extras:
-                        chamado["dados_ecotoxicologicos"] = dados_extras
-                    print(
-                        f"  📡 [SIM] Chamado #{chamado_id} → {novo_status}"
-                    )
-                    return True
-            return False
+            chamado = self._chamados_por_id.get(chamado_id)
+            if chamado is None:
+                return False
+            chamado["status"] = novo_status
+            if dados_extras:
+                chamado["dados_ecotoxicologicos"] = dados_extras
+            if self._verbose:
+                print(f"  📡 [SIM] Chamado #{chamado_id} → {novo_status}")
+            return True
 
         try:
-            import requests
-            response = requests.put(
+            response = self._get_session().put(
                 f"{self.base_url}/chamados/{chamado_id}",
                 json=payload,
-                auth=(self.username, self.password),
                 timeout=5,
             )
             response.raise_for_status()
-            print(f"  📡 [API] Chamado #{chamado_id} → {novo_status}")
+            if self._verbose:
+                print(f"  📡 [API] Chamado #{chamado_id} → {novo_status}")
             return True
         except Exception as e:
-            print(f"  ⚠️  Falha ao atualizar chamado #{chamado_id}: {e}")
-            for chamado in self._chamados_simulados:
-                if chamado["id"] == chamado_id:
+            if self._verbose:
+                print(f"  ⚠️  Falha ao atualizar chamado #{chamado_id}: {e}")
+            chamado = self._chamados_por_id.get(chamado_id)
+            if chamado is not None:
+                chamado["status"] = novo_status
+            return False
+
+    def batch_update_chamado_status(
+        self,
+        atualizacoes: list[tuple[int, str, dict[str, Any] | None]],
+    ) -> bool:
+        """
+        Atualiza vários chamados em uma única requisição (POST /chamados/batch).
+        Cada item é (chamado_id, novo_status, dados_extras).
+        """
+        if self.usar_simulacao:
+            sucesso = True
+            for chamado_id, novo_status, dados_extras in atualizacoes:
+                sucesso &= self.update_chamado_status(
+                    chamado_id, novo_status, dados_extras
+                )
+            return sucesso
+
+        payload: list[dict[str, Any]] = []
+        for chamado_id, novo_status, dados_extras in atualizacoes:
+            item: dict[str, Any] = {"id": chamado_id, "status": novo_status}
+            if dados_extras:
+                item["dados_ecotoxicologicos"] = dados_extras
+            payload.append(item)
+
+        try:
+            response = self._get_session().post(
+                f"{self.base_url}/chamados/batch",
+                json=payload,
+                timeout=5,
+            )
+            response.raise_for_status()
+            nao_encontrados = response.json().get("nao_encontrados", [])
+            if self._verbose:
+                for item in payload:
+                    if item["id"] not in nao_encontrados:
+                        print(f"  📡 [API] Chamado #{item['id']} → {item['status']}")
+            return not nao_encontrados
+        except Exception as e:
+            if self._verbose:
+                print(f"  ⚠️  Falha ao atualizar chamados em lote: {e}")
+            for chamado_id, novo_status, _dados in atualizacoes:
+                chamado = self._chamados_por_id.get(chamado_id)
+                if chamado is not None:
                     chamado["status"] = novo_status
             return False
 
     def get_chamado_coordinates(
-        self, chamado: dict[str, Any]
+        self, chamado: Mapping[str, Any]
     ) -> tuple[int, int]:
         """Extrai as coordenadas (x, y) de um chamado."""
         coords = chamado.get("coordenadas", {"x": 0, "y": 0})
@@ -1,5 +1,5 @@
 """
-agents/drone_agent.py — Agente Autônomo de Drone Sentinela
+drone_agents/drone_agent.py — Agente Autônomo de Drone Sentinela
 
 Implementa o Liskov Substitution Principle (LSP):
     AutonomousDroneAgent pode ser substituído por DroneManual
@@ -7,7 +7,8 @@ Implementa o Liskov Substitution Principle (LSP):
 
 Herda de SimpleProblemSolvingAgentProgram (AIMA, Figura 3.1):
     O agente formula objetivos, cria problemas de busca e
-    executa planos gerados por A*.
+    executa planos gerados por A* (kernel `buscar_rota`, compilado
+    com numba quando disponível).
 
 A lógica de comunicação com a API é delegada ao APIGateway (SRP).
 A lógica de busca é delegada ao PollutionMappingProblem (OCP).
@@ -17,14 +18,98 @@ from __future__ import annotations
 
 import sys
 import os
+import threading
+import weakref
+from collections import OrderedDict, deque
+from functools import lru_cache
 from typing import Any
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'aima-python'))
+import numpy as np
 
-from search import SimpleProblemSolvingAgentProgram, astar_search
+_AIMA_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'aima-python'))
+if _AIMA_PATH not in sys.path:
+    sys.path.insert(0, _AIMA_PATH)
+
+from search import SimpleProblemSolvingAgentProgram
 
 from drone_agents.api_gateway import APIGateway
-from problems.search_problem import PollutionMappingProblem
+from problems.astar_numba import (
+    ACOES,
+    buscar_rota,
+    novos_arrays_rota,
+    reconstruir_rota,
+)
+from problems.jps import jps_rota
+from problems.search_problem import URBANO, PollutionMappingProblem, construir_grid
+
+
+PLAN_CACHE_MAXSIZE: int = 128
+
+
+# Custo médio estimado por passo (mistura de células naturais e urbanas).
+CUSTO_MEDIO: float = 1.5
+
+
+def _despachar_fila(
+    fila: deque[tuple[int, str, dict[str, Any] | None]], gateway: APIGateway
+) -> None:
+    """Envia em uma única requisição todas as atualizações enfileiradas."""
+    lote = []
+    while fila:
+        lote.append(fila.popleft())
+    if lote:
+        gateway.batch_update_chamado_status(lote)
+
+
+def _laco_envio(
+    fila: deque[tuple[int, str, dict[str, Any] | None]],
+    evento: threading.Event,
+    parar: threading.Event,
+    gateway: APIGateway,
+) -> None:
+    """
+    Corpo da thread de envio. Não guarda referência ao agente, para que
+    ele possa ser coletado e o seu finalizador despachar a fila.
+    """
+    while not parar.is_set():
+        evento.wait()
+        evento.clear()
+        _despachar_fila(fila, gateway)
+
+
+def _encerrar_envio(
+    fila: deque[tuple[int, str, dict[str, Any] | None]],
+    evento: threading.Event,
+    parar: threading.Event,
+    gateway: APIGateway,
+) -> None:
+    """Para a thread de envio e despacha o que restar na fila."""
+    parar.set()
+    evento.set()
+    _despachar_fila(fila, gateway)
+
+
+@lru_cache(maxsize=256)
+def _utilidade_alvo(
+    dist_destino: int, dist_retorno_base: int, bateria: int, urbano: bool
+) -> float:
+    """MEU de ir a um alvo e depois voltar à base (recompensa 100, penalidade 150)."""
+    dist_total = dist_destino + dist_retorno_base
+    if dist_total == 0:
+        return 100.0
+    p_sucesso = min(1.0, bateria / max(dist_total * CUSTO_MEDIO, 1))
+    risco_urbano = 0.85 if urbano else 1.0
+    return p_sucesso * 100.0 * risco_urbano - (1 - p_sucesso) * 150.0
+
+
+@lru_cache(maxsize=256)
+def _utilidade_base(dist_destino: int, bateria: int, urbano: bool) -> float:
+    """MEU de voltar direto à base (recompensa 50, penalidade 100)."""
+    if dist_destino == 0:
+        return 100.0
+    p_sucesso = min(1.0, bateria / max(dist_destino * CUSTO_MEDIO, 1))
+    risco_urbano = 0.85 if urbano else 1.0
+    return p_sucesso * 50.0 * risco_urbano - (1 - p_sucesso) * 100.0
 
 
 class AutonomousDroneAgent(SimpleProblemSolvingAgentProgram):
@@ -47,9 +132,13 @@ class AutonomousDroneAgent(SimpleProblemSolvingAgentProgram):
         zonas_urbanas: set[tuple[int, int]] | None = None,
         base_position: tuple[int, int] = (0, 0),
         battery_capacity: int = 50,
+        verbose: bool = True,
     ) -> None:
         super().__init__(initial_state=None)
 
+        # Com verbose=False nenhuma mensagem é formatada nem impressa.
+        self._verbose: bool = verbose
+
         self.api_gateway: APIGateway = api_gateway
 
         self.grid_size: tuple[int, int] = grid_size
@@ -57,69 +146,218 @@ class AutonomousDroneAgent(SimpleProblemSolvingAgentProgram):
         self.zonas_urbanas: set[tuple[int, int]] = zonas_urbanas or set()
         self.base_position: tuple[int, int] = base_position
         self.battery_capacity: int = battery_capacity
+        # Grid uint8 montado uma vez e compartilhado por todos os problemas.
+        self._grid = construir_grid(grid_size, self.obstaculos, self.zonas_urbanas)
+        # Sem zonas urbanas o custo é uniforme e o mapa aberto favorece JPS.
+        self._usar_jps: bool = (
+            not self.zonas_urbanas
+            and len(self.obstaculos) < 0.2 * grid_size[0] * grid_size[1]
+        )
+        # Distância Manhattan de cada célula [x, y] até a base.
+        xs, ys = np.indices(grid_size)
+        self._dist_base: np.ndarray = (
+            np.abs(xs - base_position[0]) + np.abs(ys - base_position[1])
+        ).astype(np.int16)
 
         self._position: tuple[int, int] = base_position
         self._battery: int = battery_capacity
-        self._targets: frozenset[tuple[int, int]] = frozenset()
+        # Alvos pendentes (mutável; leituras externas recebem um frozenset),
+        # as mesmas coordenadas em array (N, 2) e a distância Manhattan de
+        # cada linha até a posição atual.
+        self._targets: set[tuple[int, int]] = set()
+        self._targets_arr: np.ndarray = np.empty((0, 2), dtype=np.int32)
+        self._dist_arr: np.ndarray = np.empty(0, dtype=np.int32)
         self._current_chamado: dict[str, Any] | None = None
         self._chamados_processados: list[dict[str, Any]] = []
         self._returning_to_base: bool = False
         self._mission_complete: bool = False
+        # Planos já calculados, por (estado inicial, objetivo, retornando).
+        # O mapa não muda durante a missão, então não entra na chave.
+        self._plan_cache: OrderedDict[tuple, list[str]] = OrderedDict()
+        # Problema reaproveitado por formulate_problem (criado na 1ª chamada).
+        self._problem: PollutionMappingProblem | None = None
+        # Atualizações de status pendentes para a API, enviadas em lote por
+        # uma thread de fundo para não bloquear o ciclo de percepção.
+        self._status_queue: deque[tuple[int, str, dict[str, Any] | None]] = deque()
+        self._status_evento = threading.Event()
+        self._status_parar = threading.Event()
+        self._status_thread: threading.Thread | None = None
+        # A thread é daemon: se ninguém chamar finalize(), a fila ainda é
+        # despachada quando o agente é coletado ou o interpretador encerra.
+        self._status_finalizador = weakref.finalize(
+            self,
+            _encerrar_envio,
+            self._status_queue,
+            self._status_evento,
+            self._status_parar,
+            api_gateway,
+        )
+        # Último estado devolvido por update_state e a chave que o identifica.
+        self._last_state: dict[str, Any] | None = None
+        self._last_state_key: tuple = ()
 
         self._sync_initial_targets()
 
     def _sync_initial_targets(self) -> None:
         """Sincroniza alvos iniciais a partir dos chamados abertos na API."""
         chamados_abertos = self.api_gateway.get_open_chamados()
-        target_coords: set[tuple[int, int]] = set()
-
-        for chamado in chamados_abertos:
-            coord = self.api_gateway.get_chamado_coordinates(chamado)
-            target_coords.add(coord)
+        # Coordenadas extraídas uma única vez por chamado (id → coord).
+        self._chamado_coord: dict[int, tuple[int, int]] = {
+            c["id"]: self.api_gateway.get_chamado_coordinates(c)
+            for c in chamados_abertos
+        }
+        target_coords: set[tuple[int, int]] = set(self._chamado_coord.values())
 
-        self._targets = frozenset(target_coords)
+        self._targets = target_coords
+        self._targets_arr = np.array(
+            list(target_coords), dtype=np.int32
+        ).reshape(-1, 2)
+        self._reconstruir_distancias()
         self._pending_chamados = list(chamados_abertos)
-
-        print(f"\n📋 Chamados abertos sincronizados: {len(chamados_abertos)}")
-        for chamado in chamados_abertos:
-            coord = self.api_gateway.get_chamado_coordinates(chamado)
-            print(f"   #{chamado['id']}: {chamado['titulo']} @ {coord}")
+        # coord → índices em `_pending_chamados` (remoção por swap-pop).
+        self._indices_por_coord: dict[tuple[int, int], list[int]] = {}
+        for i, chamado in enumerate(self._pending_chamados):
+            coord = self._chamado_coord[chamado["id"]]
+            self._indices_por_coord.setdefault(coord, []).append(i)
+
+        if self._verbose:
+            print(f"\n📋 Chamados abertos sincronizados: {len(chamados_abertos)}")
+            for chamado in chamados_abertos:
+                coord = self._chamado_coord[chamado["id"]]
+                print(f"   #{chamado['id']}: {chamado['titulo']} @ {coord}")
 
     def update_state(self, state: Any, percept: Any) -> dict[str, Any]:
         """
         Atualiza o modelo interno do agente com base nas percepções.
         Recebe o percept do ambiente e atualiza o estado interno do agente.
         """
-        if isinstance(percept, dict):
-            self._position = percept.get("location", self._position)
+        # O ambiente entrega um dict; percepções em lista não alteram o estado.
+        if type(percept) is dict:
+            self._mover_para(percept.get("location", self._position))
             self._battery = percept.get("battery", self._battery)
-        elif isinstance(percept, list):
-            pass
-
-        if self._position in self._targets:
-            self._targets = self._targets - frozenset({self._position})
-
-            for chamado in self._pending_chamados:
-                coord = self.api_gateway.get_chamado_coordinates(chamado)
-                if coord == self._position:
-                    self.api_gateway.update_chamado_status(
-                        chamado["id"],
-                        "fechado",
-                        dados_extras={
-                            "bateria_restante": self._battery,
-                            "posicao_coleta": list(self._position),
-                        },
-                    )
-                    self._chamados_processados.append(chamado)
-                    self._pending_chamados.remove(chamado)
-                    break
 
-        return {
-            "position": self._position,
-            "battery": self._battery,
-            "targets": self._targets,
-            "at_base": self._position == self.base_position,
-        }
+        posicao = self._position
+        targets = self._targets
+        if posicao in targets:
+            targets.discard(posicao)
+            i = int(np.flatnonzero(self._dist_arr == 0)[0])
+            self._targets_arr = np.delete(self._targets_arr, i, axis=0)
+            self._dist_arr = np.delete(self._dist_arr, i)
+
+            chamado = self._remover_pendente(posicao)
+            if chamado is not None:
+                self._enfileirar_status(
+                    chamado["id"],
+                    "fechado",
+                    {
+                        "bateria_restante": self._battery,
+                        "posicao_coleta": list(posicao),
+                    },
+                )
+                self._chamados_processados.append(chamado)
+
+        # Os alvos só diminuem: (posição, bateria, nº de alvos) identifica o estado.
+        chave = (posicao, self._battery, len(targets))
+        if chave != self._last_state_key:
+            self._last_state_key = chave
+            self._last_state = {
+                "position": posicao,
+                "battery": self._battery,
+                "targets": frozenset(targets),
+                "at_base": posicao == self.base_position,
+            }
+        return self._last_state
+
+    def _enfileirar_status(
+        self, chamado_id: int, status: str, dados_extras: dict[str, Any] | None
+    ) -> None:
+        """
+        Agenda a atualização de status na API. No modo simulado não há E/S
+        de rede e a atualização é aplicada na hora.
+        """
+        if self.api_gateway.usar_simulacao:
+            self.api_gateway.update_chamado_status(chamado_id, status, dados_extras)
+            return
+
+        self._status_queue.append((chamado_id, status, dados_extras))
+        if self._status_thread is None:
+            self._status_thread = threading.Thread(
+                target=_laco_envio,
+                args=(
+                    self._status_queue,
+                    self._status_evento,
+                    self._status_parar,
+                    self.api_gateway,
+                ),
+                daemon=True,
+            )
+            self._status_thread.start()
+        self._status_evento.set()
+
+    def finalize(self) -> None:
+        """
+        Encerra a thread de envio e despacha o que ainda estiver na fila.
+        Chamado automaticamente quando a missão termina.
+        """
+        if self._status_thread is not None:
+            self._status_parar.set()
+            self._status_evento.set()
+            self._status_thread.join()
+            self._status_thread = None
+            self._status_parar.clear()
+        _despachar_fila(self._status_queue, self.api_gateway)
+
+    def _remover_pendente(self, coord: tuple[int, int]) -> Any:
+        """
+        Retira de `_pending_chamados` um chamado em `coord` (None se não
+        houver), movendo o último da lista para a posição liberada.
+        """
+        indices = self._indices_por_coord.get(coord)
+        if not indices:
+            return None
+        i = indices.pop(0)
+        if not indices:
+            del self._indices_por_coord[coord]
+
+        pendentes = self._pending_chamados
+        chamado = pendentes[i]
+        ultimo = pendentes.pop()
+        if i < len(pendentes):
+            pendentes[i] = ultimo
+            indices_ultimo = self._indices_por_coord[self._chamado_coord[ultimo["id"]]]
+            indices_ultimo[indices_ultimo.index(len(pendentes))] = i
+        return chamado
+
+    def _reconstruir_distancias(self) -> None:
+        """Recalcula a distância Manhattan de cada alvo até a posição atual."""
+        self._dist_arr = np.abs(
+            self._targets_arr - np.array(self._position, dtype=np.int32)
+        ).sum(axis=1, dtype=np.int32)
+
+    def _mover_para(self, posicao: tuple[int, int]) -> None:
+        """
+        Atualiza a posição; num passo unitário cada distância em `_dist_arr`
+        muda só ±1, sem recalcular a Manhattan.
+        """
+        px, py = self._position
+        dx = posicao[0] - px
+        dy = posicao[1] - py
+        self._position = posicao
+        if dx == 0 and dy == 0:
+            return
+        if abs(dx) + abs(dy) != 1:
+            self._reconstruir_distancias()
+            return
+        if dx:
+            afastou = (self._targets_arr[:, 0] - px) * dx <= 0
+        else:
+            afastou = (self._targets_arr[:, 1] - py) * dy <= 0
+        self._dist_arr += np.where(afastou, 1, -1).astype(np.int32)
+
+    def _limpar_alvos(self) -> None:
+        self._targets.clear()
+        self._targets_arr = self._targets_arr[:0]
+        self._dist_arr = self._dist_arr[:0]
 
     def _calcular_utilidade(
         self, destino: tuple[int, int], retorno_base: bool = False
@@ -133,40 +371,13 @@ class AutonomousDroneAgent(SimpleProblemSolvingAgentProgram):
             abs(destino[0] - self._position[0])
             + abs(destino[1] - self._position[1])
         )
-
+        urbano = bool(self._grid[destino] & URBANO)
         if retorno_base:
-            dist_total = dist_destino
-        else:
-            dist_retorno_base = (
-                abs(destino[0] - self.base_position[0])
-                + abs(destino[1] - self.base_position[1])
-            )
-            dist_total = dist_destino + dist_retorno_base
-
-        if dist_total == 0:
-            return 100.0
-
-        custo_estimado = dist_total * 1.5
-        p_sucesso = min(1.0, self._battery / max(custo_estimado, 1))
-
-        if retorno_base:
-            recompensa = 50.0
-            penalidade = 100.0
-        else:
-            recompensa = 100.0
-            penalidade = 150.0
-
-        risco_urbano = 1.0
-        if destino in self.zonas_urbanas:
-            risco_urbano = 0.85
-
-        utilidade = (
-            p_sucesso * recompensa * risco_urbano
-            - (1 - p_sucesso) * penalidade
+            return _utilidade_base(dist_destino, self._battery, urbano)
+        return _utilidade_alvo(
+            dist_destino, int(self._dist_base[destino]), self._battery, urbano
         )
 
-        return utilidade
-
     def formulate_goal(self, state: Any) -> tuple[int, int] | None:
         """
         Formula o próximo objetivo do agente usando Utilidade Máxima Esperada.
@@ -184,16 +395,19 @@ class AutonomousDroneAgent(SimpleProblemSolvingAgentProgram):
         if not self._targets:
             if self._position == self.base_position:
                 self._mission_complete = True
-                print("\n✅ Missão completa! Drone na base.")
+                self.finalize()
+                if self._verbose:
+                    print("\n✅ Missão completa! Drone na base.")
                 return None
             self._returning_to_base = True
-            print(f"\n🏠 Todos os alvos coletados. Retornando à base...")
+            if self._verbose:
+                print(f"\n🏠 Todos os alvos coletados. Retornando à base...")
             return self.base_position
 
-        alvo_mais_proximo = min(
-            self._targets,
-            key=lambda t: abs(t[0] - self._position[0])
-            + abs(t[1] - self._position[1]),
+        i = int(self._dist_arr.argmin())
+        alvo_mais_proximo = (
+            int(self._targets_arr[i, 0]),
+            int(self._targets_arr[i, 1]),
         )
 
         limiar_bateria = 0.30 * self.battery_capacity
@@ -202,33 +416,33 @@ class AutonomousDroneAgent(SimpleProblemSolvingAgentProgram):
             u_alvo = self._calcular_utilidade(alvo_mais_proximo, retorno_base=False)
             u_base = self._calcular_utilidade(self.base_position, retorno_base=True)
 
-            print(f"\n⚡ Bateria baixa ({self._battery}/{self.battery_capacity}"
-                  f" = {self._battery / self.battery_capacity * 100:.0f}%)")
-            print(f"  📊 MEU — Utilidade Máxima Esperada (AIMA Cap. 16):")
-            print(f"     U(ir ao alvo {alvo_mais_proximo})  = {u_alvo:.2f}")
-            print(f"     U(voltar à base {self.base_position}) = {u_base:.2f}")
+            if self._verbose:
+                print(f"\n⚡ Bateria baixa ({self._battery}/{self.battery_capacity}"
+                      f" = {self._battery / self.battery_capacity * 100:.0f}%)")
+                print(f"  📊 MEU — Utilidade Máxima Esperada (AIMA Cap. 16):")
+                print(f"     U(ir ao alvo {alvo_mais_proximo})  = {u_alvo:.2f}")
+                print(f"     U(voltar à base {self.base_position}) = {u_base:.2f}")
 
             if u_base > u_alvo:
-                print(f"  🔋 Decisão MEU: RETORNAR À BASE (utilidade maior)")
+                if self._verbose:
+                    print(f"  🔋 Decisão MEU: RETORNAR À BASE (utilidade maior)")
                 self._returning_to_base = True
-                self._targets = frozenset()
+                self._limpar_alvos()
                 return self.base_position
-            else:
+            elif self._verbose:
                 print(f"  🎯 Decisão MEU: IR AO ALVO (utilidade maior)")
 
-        for chamado in self._pending_chamados:
-            coord = self.api_gateway.get_chamado_coordinates(chamado)
-            if coord == alvo_mais_proximo:
-                self.api_gateway.update_chamado_status(
-                    chamado["id"], "em_andamento"
-                )
-                self._current_chamado = chamado
-                break
+        indices = self._indices_por_coord.get(alvo_mais_proximo)
+        if indices:
+            chamado = self._pending_chamados[indices[0]]
+            self._enfileirar_status(chamado["id"], "em_andamento", None)
+            self._current_chamado = chamado
 
-        print(
-            f"\n🎯 Objetivo: {alvo_mais_proximo} "
-            f"(Bateria: {self._battery})"
-        )
+        if self._verbose:
+            print(
+                f"\n🎯 Objetivo: {alvo_mais_proximo} "
+                f"(Bateria: {self._battery})"
+            )
         return alvo_mais_proximo
 
     def formulate_problem(
@@ -236,13 +450,11 @@ class AutonomousDroneAgent(SimpleProblemSolvingAgentProgram):
     ) -> PollutionMappingProblem:
         """
         Formula o problema de busca para o objetivo atual.
-        Cria uma instância de PollutionMappingProblem com o estado
-        atual do agente e o objetivo determinado por formulate_goal.
+        Reaproveita uma única instância de PollutionMappingProblem (o mapa
+        não muda), trocando apenas o estado atual do agente e o objetivo
+        determinado por formulate_goal.
         """
-        if self._returning_to_base:
-            targets = frozenset()
-        else:
-            targets = frozenset({goal})
+        targets = () if self._returning_to_base else (goal,)
 
         initial_state = (
             self._position[0],
@@ -251,61 +463,90 @@ class AutonomousDroneAgent(SimpleProblemSolvingAgentProgram):
             targets,
         )
 
-        problem = PollutionMappingProblem(
-            initial=initial_state,
-            goal=self.base_position if self._returning_to_base else goal,
-            grid_size=self.grid_size,
-            obstaculos=self.obstaculos,
-            zonas_urbanas=self.zonas_urbanas,
-        )
+        objetivo = self.base_position if self._returning_to_base else goal
+        problem = self._problem
+        if problem is None:
+            problem = self._problem = PollutionMappingProblem(
+                initial=initial_state,
+                goal=objetivo,
+                grid_size=self.grid_size,
+                obstaculos=self.obstaculos,
+                zonas_urbanas=self.zonas_urbanas,
+                grid=self._grid,
+            )
+        else:
+            problem.redefinir(initial_state, objetivo)
 
-        print(
-            f"  📐 Problema formulado: {self._position} → {goal} "
-            f"(grid {self.grid_size[0]}×{self.grid_size[1]})"
-        )
+        if self._verbose:
+            print(
+                f"  📐 Problema formulado: {self._position} → {goal} "
+                f"(grid {self.grid_size[0]}×{self.grid_size[1]})"
+            )
         return problem
 
     def search(self, problem: PollutionMappingProblem) -> list[str]:
         """
         Executa busca A* para encontrar sequência ótima de ações.
-        Utiliza astar_search do AIMA com a heurística h() definida
-        no PollutionMappingProblem (Manhattan + Vento Atlântico).
+        O problema formulado é resolvido pelo kernel `buscar_rota` sobre o
+        grid do agente (mesmo modelo de custo e bateria do
+        PollutionMappingProblem, heurística Manhattan); em mapas sem zonas
+        urbanas e com poucos obstáculos tenta-se antes `jps_rota`.
         """
-        print("  🔍 Executando A* Search...")
-
-        result = astar_search(problem)
-
-        if result is None:
-            print("  ❌ Nenhuma solução encontrada!")
-            if not self._returning_to_base:
-                print("  🔄 Tentando retornar à base...")
-                self._returning_to_base = True
-                self._targets = frozenset()
-                return_problem = PollutionMappingProblem(
-                    initial=(
-                        self._position[0],
-                        self._position[1],
-                        self._battery,
-                        frozenset(),
-                    ),
-                    goal=self.base_position,
-                    grid_size=self.grid_size,
-                    obstaculos=self.obstaculos,
-                    zonas_urbanas=self.zonas_urbanas,
-                )
-                fallback = astar_search(return_problem)
-                if fallback:
-                    actions = fallback.solution()
-                    print(f"  ✈️  Rota de retorno: {actions}")
-                    return actions
-            return []
+        if self._verbose:
+            print("  🔍 Executando A* Search...")
+
+        chave = (problem.initial, problem.goal, self._returning_to_base)
+        plano = self._plan_cache.get(chave)
+        if plano is not None:
+            self._plan_cache.move_to_end(chave)
+            if self._verbose:
+                print(f"  ✈️  Plano: {plano} ({len(plano)} ações)")
+            return list(plano)
+
+        x, y = self._position
+        gx, gy = problem.base
+        actions = None
+        if self._usar_jps:
+            actions = jps_rota(self._grid, x, y, self._battery, gx, gy)
+
+        if actions is None:
+            g, acao_pai, fechado = novos_arrays_rota(self._grid)
+            custo = buscar_rota(
+                self._grid, x, y, self._battery, gx, gy, g, acao_pai, fechado
+            )
 
-        actions = result.solution()
+            if custo < 0:
+                if self._verbose:
+                    print("  ❌ Nenhuma solução encontrada!")
+                if not self._returning_to_base:
+                    if self._verbose:
+                        print("  🔄 Tentando retornar à base...")
+                    self._returning_to_base = True
+                    self._limpar_alvos()
+                    # A busca que falhou esgotou as células alcançáveis a partir
+                    # da mesma origem e bateria: a rota até a base já está em
+                    # `acao_pai`, ou a base é inalcançável.
+                    bx, by = self.base_position
+                    if fechado[bx, by]:
+                        rota = reconstruir_rota(acao_pai, x, y, bx, by)
+                        fallback = [ACOES[k] for k in rota]
+                        if fallback:
+                            if self._verbose:
+                                print(f"  ✈️  Rota de retorno: {fallback}")
+                            return fallback
+                return []
+
+            actions = [ACOES[k] for k in reconstruir_rota(acao_pai, x, y, gx, gy)]
 
         if not self._returning_to_base:
             actions.append("COLETAR")
 
-        print(f"  ✈️  Plano: {actions} ({len(actions)} ações)")
+        self._plan_cache[chave] = list(actions)
+        if len(self._plan_cache) > PLAN_CACHE_MAXSIZE:
+            self._plan_cache.popitem(last=False)
+
+        if self._verbose:
+            print(f"  ✈️  Plano: {actions} ({len(actions)} ações)")
         return actions
 
     # ----------------------------------------------------------------
@@ -16,21 +16,43 @@ multiplicando o consumo de bateria por 3× conforme as diretrizes do projeto.
 
 from __future__ import annotations
 
+import heapq
 import sys
 import os
 from typing import Any
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'aima-python'))
+import numpy as np
+
+_AIMA_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'aima-python'))
+if _AIMA_PATH not in sys.path:
+    sys.path.insert(0, _AIMA_PATH)
 
 from agents import Thing, Agent, XYEnvironment
 
+from problems.astar_numba import ACOES, a_star_rota
+from problems.search_problem import OBSTACULO, URBANO
+
 try:
     from agents import Obstacle
 except ImportError:
     class Obstacle(Thing):
         """Fallback caso Obstacle não exista na versão do AIMA."""
-        pass
+        __slots__ = ()
+
 
+# Ações sem deslocamento. Literais com cara de identificador já são
+# internados pelo compilador, e str == testa identidade antes de comparar
+# caracteres; mantém-se == para aceitar strings montadas em tempo de execução.
+ACAO_COLETAR: str = sys.intern("COLETAR")
+ACAO_NOOP: str = sys.intern("NoOp")
+
+# Deslocamento (dx, dy) de cada ação de movimento.
+_MOVIMENTOS: dict[str, tuple[int, int]] = {
+    "CIMA":     (0, -1),
+    "BAIXO":    (0,  1),
+    "ESQUERDA": (-1, 0),
+    "DIREITA":  (1,  0),
+}
 
 
 class PollutionSample(Thing):
@@ -40,15 +62,34 @@ class PollutionSample(Thing):
     ou contaminante a ser coletada pelo drone sentinela.
     """
 
+    # Thing (AIMA) não define __slots__, então `location` ainda vai para o
+    # __dict__; os atributos próprios da amostra ficam em slots.
+    __slots__ = ("chamado_id", "titulo", "_coletado", "_status_char")
+
     def __init__(self, chamado_id: int = 0, titulo: str = "Amostra") -> None:
         super().__init__()
         self.chamado_id: int = chamado_id
         self.titulo: str = titulo
-        self.coletado: bool = False
+        self._coletado: bool = False
+        self._status_char: str = "○"
+
+    @property
+    def coletado(self) -> bool:
+        """Indica se a amostra já foi coletada."""
+        return self._coletado
+
+    @coletado.setter
+    def coletado(self, valor: bool) -> None:
+        # O símbolo de status acompanha a flag, sem ternário em __repr__.
+        self._coletado = valor
+        self._status_char = "✓" if valor else "○"
+
+    def coletar(self) -> None:
+        """Marca a amostra como coletada."""
+        self.coletado = True
 
     def __repr__(self) -> str:
-        status = "✓" if self.coletado else "○"
-        return f"[{status}] Amostra({self.chamado_id}: {self.titulo})"
+        return f"[{self._status_char}] Amostra({self.chamado_id}: {self.titulo})"
 
 
 class MangroveObstacle(Obstacle):
@@ -58,6 +99,8 @@ class MangroveObstacle(Obstacle):
     seu caminho ao encontrá-los.
     """
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return "🌿 Mangue"
 
@@ -79,15 +122,54 @@ class PoximEnvironment(XYEnvironment):
         zonas_urbanas: set[tuple[int, int]] | None = None,
         base_position: tuple[int, int] = (0, 0),
         battery_capacity: int = 50,
+        verbose: bool = True,
+        record: bool = False,
     ) -> None:
         super().__init__(width, height)
+        # Com verbose=False execute_action não formata nem imprime mensagens;
+        # com record=True cada movimento vira uma tupla em self._log.
+        self._verbose: bool = verbose
+        self.record: bool = record
+        self._log: list[tuple[int, str, tuple[int, int], int]] = []
         self.zonas_urbanas: set[tuple[int, int]] = zonas_urbanas or set()
+        # Custo de bateria por célula em lista achatada (índice x * altura + y),
+        # como em PollutionMappingProblem: indexar lista é mais barato que
+        # consultar o set (ou um ndarray escalar) a cada movimento.
+        self._custo_celula: list[int] = [1] * (width * height)
+        for x, y in self.zonas_urbanas:
+            if 0 <= x < width and 0 <= y < height:
+                self._custo_celula[x * height + y] = 3
+        # Mesma informação como grid int8 [x, y] (convenção de construir_grid),
+        # para planejadores que queiram os pesos das arestas de uma vez.
+        self._cost_grid: np.ndarray = np.array(
+            self._custo_celula, dtype=np.int8
+        ).reshape(width, height)
+        # Custo real de cada célula até a base (ver h_to_base); calculado sob
+        # demanda e descartado quando obstáculos entram ou saem do ambiente.
+        self._h_to_base: np.ndarray | None = None
         self.base_position: tuple[int, int] = base_position
         self.battery_capacity: int = battery_capacity
 
         self._agent_batteries: dict[int, int] = {}
         self._agent_samples: dict[int, list[PollutionSample]] = {}
         self._step_count: int = 0
+        # Contadores sobre os agentes do ambiente (ids em _agentes_contados),
+        # atualizados a cada mudança de posição ou bateria: quantos estão
+        # fora da base e quantos ainda têm bateria.
+        self._agentes_contados: set[int] = set()
+        self._fora_da_base: int = 0
+        self._com_bateria: int = 0
+        # Índices por posição, mantidos em add_thing/delete_thing, para não
+        # varrer self.things a cada movimento, coleta ou checagem de fim.
+        self._samples_by_pos: dict[tuple[int, int], list[PollutionSample]] = {}
+        self._things_by_cell: dict[tuple[int, int], list[Thing]] = {}
+        self._obstacles_by_pos: dict[tuple[int, int], int] = {}
+        self._uncollected_count: int = 0
+        # Coordenadas das amostras em arrays paralelos (mesma ordem de
+        # _samples) para o filtro de vizinhança vetorizado de percept.
+        self._samples: list[PollutionSample] = []
+        self._sample_xs: np.ndarray = np.empty(0, dtype=np.int32)
+        self._sample_ys: np.ndarray = np.empty(0, dtype=np.int32)
 
     # ----------------------------------------------------------------
     # Métodos herdados de Environment
@@ -102,17 +184,23 @@ class PoximEnvironment(XYEnvironment):
         location = agent.location
         battery = self._agent_batteries.get(agent_id, self.battery_capacity)
 
-        nearby = self.things_near(agent.location, radius=1)
+        # Mesmo critério de things_near(location, radius=1), restrito às
+        # amostras: (amostra, raio² - distância²) para distância² <= raio².
+        dx = self._sample_xs - location[0]
+        dy = self._sample_ys - location[1]
+        folga = 1 - (dx * dx + dy * dy)
+        indices = np.flatnonzero(folga >= 0)
         nearby_samples = [
-            (thing, dist) for thing, dist in nearby
-            if isinstance(thing, PollutionSample) and not thing.coletado
+            (self._samples[i], f)
+            for i, f in zip(indices.tolist(), folga[indices].tolist())
+            if not self._samples[i].coletado
         ]
 
         return {
             "location": location,
             "battery": battery,
             "nearby_samples": nearby_samples,
-            "is_urban": location in self.zonas_urbanas,
+            "is_urban": self._custo_celula[location[0] * self.height + location[1]] == 3,
             "at_base": location == self.base_position,
         }
 
@@ -122,73 +210,93 @@ class PoximEnvironment(XYEnvironment):
         O custo de bateria é 1 por movimento em área natural,
         e 3 por movimento em zona urbana (Urban Penalty).
         """
-        if action is None or action == "NoOp":
+        if action is None or action == ACAO_NOOP:
             return
 
+        contado = id(agent) in self._agentes_contados
+        if contado:
+            self._contar_agente(agent, -1)
+        try:
+            self._executar_acao(agent, action)
+        finally:
+            if contado:
+                self._contar_agente(agent, 1)
+
+    def _executar_acao(self, agent: Agent, action: str) -> None:
+        """Corpo de execute_action, sem a manutenção dos contadores."""
         agent_id = id(agent)
-        if agent_id not in self._agent_batteries:
-            self._agent_batteries[agent_id] = self.battery_capacity
-
-        if self._agent_batteries[agent_id] <= 0:
-            print(f"⚠️  Drone sem bateria em {agent.location}! Ação ignorada.")
+        batteries = self._agent_batteries
+        bateria = batteries.get(agent_id)
+        if bateria is None:
+            bateria = batteries[agent_id] = self.battery_capacity
+
+        if bateria <= 0:
+            if self._verbose:
+                print(f"⚠️  Drone sem bateria em {agent.location}! Ação ignorada.")
             return
 
-        movement_map: dict[str, tuple[int, int]] = {
-            "CIMA":     (0, -1),
-            "BAIXO":    (0,  1),
-            "ESQUERDA": (-1, 0),
-            "DIREITA":  (1,  0),
-        }
-
-        if action in movement_map:
-            dx, dy = movement_map[action]
+        delta = _MOVIMENTOS.get(action)
+        if delta is not None:
+            dx, dy = delta
             x, y = agent.location
             new_location = (x + dx, y + dy)
 
             if not self.is_inbounds(new_location):
                 agent.bump = True
-                print(f"⚠️  Movimento bloqueado: {new_location} fora dos limites.")
+                if self._verbose:
+                    print(f"⚠️  Movimento bloqueado: {new_location} fora dos limites.")
                 return
 
-            if self.some_things_at(new_location, Obstacle):
+            if new_location in self._obstacles_by_pos:
                 agent.bump = True
-                print(f"⚠️  Movimento bloqueado: obstáculo em {new_location}.")
+                if self._verbose:
+                    print(f"⚠️  Movimento bloqueado: obstáculo em {new_location}.")
                 return
 
-            custo_bateria = 3 if new_location in self.zonas_urbanas else 1
+            custo_bateria = self._custo_celula[new_location[0] * self.height + new_location[1]]
 
-            if self._agent_batteries[agent_id] < custo_bateria:
-                print(f"⚠️  Bateria insuficiente para mover ({custo_bateria} necessário).")
+            if bateria < custo_bateria:
+                if self._verbose:
+                    print(f"⚠️  Bateria insuficiente para mover ({custo_bateria} necessário).")
                 return
 
             old_location = agent.location
             agent.location = new_location
-            self._agent_batteries[agent_id] -= custo_bateria
-
-            zona = "🏙️  URBANA" if new_location in self.zonas_urbanas else "🌊 natural"
-            print(
-                f"  → {action}: {old_location} → {new_location} "
-                f"| Bateria: -{custo_bateria} ({zona}) "
-                f"| Restante: {self._agent_batteries[agent_id]}"
-            )
+            self._reindexar(agent, old_location)
+            bateria -= custo_bateria
+            batteries[agent_id] = bateria
+            if self.record:
+                self._log.append((self._step_count, action, new_location, custo_bateria))
+
+            if self._verbose:
+                zona = "🏙️  URBANA" if custo_bateria == 3 else "🌊 natural"
+                print(
+                    f"  → {action}: {old_location} → {new_location} "
+                    f"| Bateria: -{custo_bateria} ({zona}) "
+                    f"| Restante: {bateria}"
+                )
             return
 
-        if action == "COLETAR":
-            samples_here = self.list_things_at(agent.location, PollutionSample)
+        if action == ACAO_COLETAR:
+            samples_here = self._samples_by_pos.get(agent.location)
             if samples_here:
                 for sample in samples_here:
                     if not sample.coletado:
-                        sample.coletado = True
+                        sample.coletar()
+                        self._uncollected_count -= 1
                         if agent_id not in self._agent_samples:
                             self._agent_samples[agent_id] = []
                         self._agent_samples[agent_id].append(sample)
-                        print(f"  🧪 Amostra coletada: {sample}")
-                        self._agent_batteries[agent_id] -= 1
-            else:
+                        if self._verbose:
+                            print(f"  🧪 Amostra coletada: {sample}")
+                        bateria -= 1
+                batteries[agent_id] = bateria
+            elif self._verbose:
                 print(f"  ℹ️  Nenhuma amostra para coletar em {agent.location}.")
             return
 
-        print(f"  ❓ Ação desconhecida: '{action}'")
+        if self._verbose:
+            print(f"  ❓ Ação desconhecida: '{action}'")
 
     # ----------------------------------------------------------------
     # Métodos auxiliares
@@ -198,6 +306,74 @@ class PoximEnvironment(XYEnvironment):
         """Retorna o nível atual de bateria de um agente."""
         return self._agent_batteries.get(id(agent), self.battery_capacity)
 
+    def get_move_cost(self, pos: tuple[int, int]) -> int:
+        """Retorna o custo de bateria para entrar na célula `pos`."""
+        return self._custo_celula[pos[0] * self.height + pos[1]]
+
+    def plan_path(
+        self, start: tuple[int, int], goal: tuple[int, int]
+    ) -> list[str] | None:
+        """
+        Caminho de custo mínimo de `start` até `goal` no mapa atual.
+
+        Usa o kernel A* de problems.astar_numba (heurística Manhattan,
+        admissível pois o menor custo de passo é 1) sobre os custos de
+        `_cost_grid` e os obstáculos presentes no ambiente, sem limite de
+        bateria.
+
+        Returns:
+            list[str] | None: Ações de movimento, ou None sem caminho
+                (inclusive com `start` ou `goal` fora do grid ou sobre
+                um obstáculo).
+        """
+        for pos in (start, goal):
+            if not self.is_inbounds(pos) or pos in self._obstacles_by_pos:
+                return None
+        grid = np.where(self._cost_grid == 3, URBANO, 0).astype(np.uint8)
+        for x, y in self._obstacles_by_pos:
+            grid[x, y] |= OBSTACULO
+        limite = 3 * self.width * self.height
+        custo, acoes = a_star_rota(grid, start[0], start[1], limite, goal[0], goal[1])
+        if custo < 0:
+            return None
+        return [ACOES[k] for k in acoes.tolist()]
+
+    def h_to_base(self, pos: tuple[int, int]) -> int:
+        """
+        Custo mínimo de bateria de `pos` até a base (-1 se inalcançável).
+
+        Heurística perfeita para o trecho de retorno: a tabela vem de um
+        Dijkstra reverso a partir da base, sem limite de bateria.
+        """
+        if self._h_to_base is None:
+            self._h_to_base = self._dijkstra_reverso()
+        return int(self._h_to_base[pos[0], pos[1]])
+
+    def _dijkstra_reverso(self) -> np.ndarray:
+        """Tabela [x, y] de custos até base_position; -1 onde não há caminho."""
+        largura, altura = self.width, self.height
+        custo = self._custo_celula
+        bloqueada = [False] * (largura * altura)
+        for x, y in self._obstacles_by_pos:
+            bloqueada[x * altura + y] = True
+        dist = [-1] * (largura * altura)
+        bx, by = self.base_position
+        heap = [(0, bx * altura + by)]
+        while heap:
+            d, i = heapq.heappop(heap)
+            if dist[i] >= 0:
+                continue
+            dist[i] = d
+            # Ir de um vizinho até i custa a entrada em i.
+            d_vizinho = d + custo[i]
+            x, y = divmod(i, altura)
+            for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                if 0 <= nx < largura and 0 <= ny < altura:
+                    j = nx * altura + ny
+                    if dist[j] < 0 and not bloqueada[j]:
+                        heapq.heappush(heap, (d_vizinho, j))
+        return np.array(dist, dtype=np.int32).reshape(largura, altura)
+
     def get_collected_samples(self, agent: Agent) -> list[PollutionSample]:
         """Retorna a lista de amostras coletadas por um agente."""
         return self._agent_samples.get(id(agent), [])
@@ -209,24 +385,38 @@ class PoximEnvironment(XYEnvironment):
         - Não há agentes vivos, OU
         - Todos os agentes estão sem bateria, OU
         - Todas as amostras foram coletadas e agentes na base
+
+        Com todos os agentes vivos, a decisão sai dos contadores mantidos
+        incrementalmente; só a vivacidade, que o próprio agente pode
+        alterar, é conferida a cada chamada.
         """
-        if not any(agent.is_alive() for agent in self.agents):
+        vivos = 0
+        for agent in self.agents:
+            if agent.is_alive():
+                vivos += 1
+        if not vivos:
             return True
 
-        all_samples = [t for t in self.things if isinstance(t, PollutionSample)]
-        all_collected = all(s.coletado for s in all_samples) if all_samples else True
-
-        all_at_base = all(
-            agent.location == self.base_position
-            for agent in self.agents if agent.is_alive()
-        )
-
-        all_drained = all(
-            self._agent_batteries.get(id(agent), 0) <= 0
-            for agent in self.agents if agent.is_alive()
-        )
-
-        return all_collected and all_at_base or all_drained
+        if vivos == len(self.agents):
+            # Todos vivos: os contadores valem para o conjunto inteiro.
+            all_at_base = self._fora_da_base == 0
+            all_drained = self._com_bateria == 0
+        else:
+            baterias = self._agent_batteries
+            base = self.base_position
+            all_at_base = True
+            all_drained = True
+            for agent in self.agents:
+                if not agent.is_alive():
+                    continue
+                if agent.location != base:
+                    all_at_base = False
+                if baterias.get(id(agent), 0) > 0:
+                    all_drained = False
+
+        all_collected = self._uncollected_count == 0
+
+        return (all_collected and all_at_base) or all_drained
 
     def step(self) -> None:
         """Executa um passo da simulação, rastreando o número de passos."""
@@ -237,6 +427,135 @@ class PoximEnvironment(XYEnvironment):
         """Retorna o número de passos executados na simulação."""
         return self._step_count
 
+    def get_log(self) -> list[tuple[int, str, tuple[int, int], int]]:
+        """Retorna os movimentos registrados (passo, ação, destino, custo)."""
+        return self._log
+
+    def add_thing(
+        self,
+        thing: Thing,
+        location: tuple[int, int] = (1, 1),
+        exclude_duplicate_class_items: bool = False,
+    ) -> None:
+        """Adiciona um objeto ao ambiente e o registra nos índices por posição."""
+        total = len(self.things)
+        super().add_thing(thing, location, exclude_duplicate_class_items)
+        if len(self.things) == total:
+            return
+        pos = thing.location
+        self._things_by_cell.setdefault(pos, []).append(thing)
+        if isinstance(thing, Agent):
+            self._agentes_contados.add(id(thing))
+            self._contar_agente(thing, 1)
+        if isinstance(thing, PollutionSample):
+            self._samples_by_pos.setdefault(pos, []).append(thing)
+            self._samples.append(thing)
+            self._sample_xs = np.append(self._sample_xs, np.int32(pos[0]))
+            self._sample_ys = np.append(self._sample_ys, np.int32(pos[1]))
+            if not thing.coletado:
+                self._uncollected_count += 1
+        elif isinstance(thing, Obstacle):
+            self._obstacles_by_pos[pos] = self._obstacles_by_pos.get(pos, 0) + 1
+            self._h_to_base = None
+
+    def delete_thing(self, thing: Thing) -> None:
+        """Remove um objeto do ambiente e dos índices por posição."""
+        presente = thing in self.things
+        super().delete_thing(thing)
+        if not presente:
+            return
+        pos = thing.location
+        self._remover_da_celula(thing, pos)
+        if isinstance(thing, Agent):
+            self._contar_agente(thing, -1)
+            self._agentes_contados.discard(id(thing))
+            # As chaves são id(agent): sem isto, um objeto novo que reutilize
+            # o mesmo id herdaria a bateria e as amostras do agente removido.
+            self._agent_batteries.pop(id(thing), None)
+            self._agent_samples.pop(id(thing), None)
+        if isinstance(thing, PollutionSample):
+            amostras = self._samples_by_pos[pos]
+            amostras.remove(thing)
+            if not amostras:
+                del self._samples_by_pos[pos]
+            i = self._samples.index(thing)
+            del self._samples[i]
+            self._sample_xs = np.delete(self._sample_xs, i)
+            self._sample_ys = np.delete(self._sample_ys, i)
+            if not thing.coletado:
+                self._uncollected_count -= 1
+        elif isinstance(thing, Obstacle):
+            self._h_to_base = None
+            restantes = self._obstacles_by_pos[pos] - 1
+            if restantes:
+                self._obstacles_by_pos[pos] = restantes
+            else:
+                del self._obstacles_by_pos[pos]
+
+    def move_to(self, thing: Thing, destination: tuple[int, int]) -> bool:
+        """Move um objeto (ver XYEnvironment.move_to) mantendo o índice por célula."""
+        origem = thing.location
+        contado = id(thing) in self._agentes_contados
+        if contado:
+            self._contar_agente(thing, -1)
+        bump = super().move_to(thing, destination)
+        if not bump:
+            self._reindexar(thing, origem)
+        if contado:
+            self._contar_agente(thing, 1)
+        return bump
+
+    def _contar_agente(self, agent: Agent, sinal: int) -> None:
+        """Soma (sinal=1) ou retira (sinal=-1) o agente dos contadores."""
+        if agent.location != self.base_position:
+            self._fora_da_base += sinal
+        if self._agent_batteries.get(id(agent), 0) > 0:
+            self._com_bateria += sinal
+
+    def things_near(
+        self, location: tuple[int, int], radius: float | None = None
+    ) -> list[tuple[Thing, float]]:
+        """
+        Objetos a distância euclidiana <= radius de location.
+
+        Mesmo resultado de XYEnvironment.things_near, (objeto, raio² -
+        distância²), mas consultando só as células do entorno no índice
+        por célula em vez de percorrer todos os objetos. A ordem segue as
+        células, não a ordem de inserção.
+        """
+        if radius is None:
+            radius = self.perceptible_distance
+        radius2 = radius * radius
+        alcance = int(radius)
+        x0, y0 = location
+        celulas = self._things_by_cell
+        proximos: list[tuple[Thing, float]] = []
+        for dx in range(-alcance, alcance + 1):
+            for dy in range(-alcance, alcance + 1):
+                folga = radius2 - (dx * dx + dy * dy)
+                if folga < 0:
+                    continue
+                for thing in celulas.get((x0 + dx, y0 + dy), ()):
+                    proximos.append((thing, folga))
+        return proximos
+
+    def _remover_da_celula(self, thing: Thing, pos: tuple[int, int]) -> None:
+        """Tira `thing` do balde da célula `pos` no índice por célula."""
+        balde = self._things_by_cell[pos]
+        balde.remove(thing)
+        if not balde:
+            del self._things_by_cell[pos]
+
+    def _reindexar(self, thing: Thing, origem: tuple[int, int]) -> None:
+        """Atualiza o índice por célula após `thing` sair de `origem`."""
+        if thing.location == origem:
+            return
+        balde = self._things_by_cell.get(origem)
+        if balde is None or thing not in balde:
+            return  # objeto que não foi adicionado ao ambiente
+        self._remover_da_celula(thing, origem)
+        self._things_by_cell.setdefault(thing.location, []).append(thing)
+
     def add_agent_at(
         self, agent: Agent, location: tuple[int, int] | None = None
     ) -> None:
@@ -246,49 +565,47 @@ class PoximEnvironment(XYEnvironment):
         """
         loc = location or self.base_position
         self.add_thing(agent, loc)
+        contado = id(agent) in self._agentes_contados
+        if contado:
+            self._contar_agente(agent, -1)
         self._agent_batteries[id(agent)] = self.battery_capacity
+        if contado:
+            self._contar_agente(agent, 1)
         self._agent_samples[id(agent)] = []
 
     def print_grid(self) -> None:
         """Imprime uma representação visual do grid do ambiente."""
-        print(f"\n{'='*40}")
-        print(f"  Grid do Estuário ({self.width}×{self.height})")
-        print(f"{'='*40}")
-
-        for y in range(self.height):
-            row = ""
-            for x in range(self.width):
-                pos = (x, y)
-
-                has_agent = any(
-                    a.location == pos for a in self.agents if a.is_alive()
-                )
-                has_sample = any(
-                    isinstance(t, PollutionSample) and not t.coletado
-                    for t in self.list_things_at(pos)
-                )
-                has_obstacle = self.some_things_at(pos, Obstacle)
-                is_base = pos == self.base_position
-                is_urban = pos in self.zonas_urbanas
-
-                if has_agent:
-                    row += " 🤖"
-                elif has_sample and is_urban:
-                    row += " 🟠"  # amostra em zona urbana (custo 3x)
-                elif has_sample:
-                    row += " 🔴"  # amostra em área natural (custo 1x)
-                elif has_obstacle:
-                    row += " 🌿"
-                elif is_base:
-                    row += " 🏠"
-                elif is_urban:
-                    row += " 🏙️"
-                else:
-                    row += " · "
-
-            print(f"  {y:2d} |{row}")
-
-        x_labels = "".join(f" {x:2d}" for x in range(self.width))
-        print(f"     +{'---' * self.width}")
-        print(f"      {x_labels}")
-        print()
+        # Preenche as células em ordem crescente de prioridade; cada camada
+        # sobrescreve a anterior (agente > amostra > obstáculo > base > urbana).
+        largura, altura = self.width, self.height
+        urbanas = self.zonas_urbanas
+        celulas = [[" · "] * largura for _ in range(altura)]
+        for x, y in urbanas:
+            celulas[y][x] = " 🏙️"
+        bx, by = self.base_position
+        celulas[by][bx] = " 🏠"
+        for x, y in self._obstacles_by_pos:
+            celulas[y][x] = " 🌿"
+        for pos, amostras in self._samples_by_pos.items():
+            if all(amostra.coletado for amostra in amostras):
+                continue
+            x, y = pos
+            # 🟠 amostra em zona urbana (custo 3x); 🔴 em área natural (1x)
+            celulas[y][x] = " 🟠" if pos in urbanas else " 🔴"
+        for agent in self.agents:
+            if agent.is_alive():
+                x, y = agent.location
+                celulas[y][x] = " 🤖"
+
+        # Monta o quadro inteiro e imprime de uma vez.
+        linhas = [
+            f"\n{'='*40}",
+            f"  Grid do Estuário ({largura}×{altura})",
+            f"{'='*40}",
+        ]
+        linhas.extend(f"  {y:2d} |{''.join(row)}" for y, row in enumerate(celulas))
+        x_labels = "".join(f" {x:2d}" for x in range(largura))
+        linhas.append(f"     +{'---' * largura}")
+        linhas.append(f"      {x_labels}")
+        linhas.append("")
+        sys.stdout.write("\n".join(linhas) + "\n")
@@ -13,6 +13,8 @@ Isso permite:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Protocol, runtime_checkable
 
 
@@ -41,7 +43,7 @@ class ChemicalSensor(Protocol):
     na água e sedimentos do estuário.
     """
 
-    def get_contamination_reading(self) -> dict[str, float]:
+    def get_contamination_reading(self) -> Mapping[str, float]:
         """
         Retorna leitura de contaminantes detectados.
         Ex: {"mercurio": 0.05, "chumbo": 0.12, "OD": 3.2}
@@ -81,6 +83,8 @@ class VisionSensor(Protocol):
 class SimulatedTelemetry:
     """Implementação simulada do sensor de telemetria."""
 
+    __slots__ = ("_position", "_battery")
+
     def __init__(self, initial_position: tuple[float, float] = (0.0, 0.0),
                  initial_battery: float = 100.0) -> None:
         self._position = initial_position
@@ -102,15 +106,23 @@ class SimulatedTelemetry:
 class SimulatedChemical:
     """Implementação simulada do sensor químico."""
 
+    __slots__ = ("_readings", "_readings_view")
+
     def __init__(self, default_readings: dict[str, float] | None = None) -> None:
         self._readings = default_readings or {
             "mercurio": 0.0,
             "chumbo": 0.0,
             "OD": 6.5
         }
+        self._readings_view = MappingProxyType(self._readings)
 
-    def get_contamination_reading(self) -> dict[str, float]:
-        return dict(self._readings)
+    def get_contamination_reading(self) -> Mapping[str, float]:
+        """
+        Visão somente leitura das leituras atuais, sem cópia; reflete
+        alterações feitas por `set_contamination`. Quem precisar guardar
+        a leitura deve copiá-la.
+        """
+        return self._readings_view
 
     def set_contamination(self, readings: dict[str, float]) -> None:
         self._readings.update(readings)
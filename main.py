@@ -6,25 +6,69 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'aima-python'))
 from search import Problem
 
 class SentinelaEstuarino(Problem):
-    def __init__(self, initial, goal, grid_limites, obstaculos):
-        super().__init__(initial, goal)
+    """
+    Alvos pendentes no estado são uma máscara de bits: o bit i marca
+    self.alvos[i]. `initial` pode trazer as coordenadas (convertidas aqui)
+    ou já a máscara, com `alvos` definindo a ordem dos bits.
+    """
+
+    __slots__ = (
+        'alvos', '_bit_alvo', 'max_x', 'max_y', 'obstaculos', 'base',
+        '_altura', '_h_cache', '_dist_alvo_base', '_acoes_na_celula',
+        '_dist_pares', '_mst_cache',
+    )
+
+    def __init__(self, initial, goal, grid_limites, obstaculos, alvos=None):
+        x, y, bateria, pendentes = initial
+        if isinstance(pendentes, int):
+            self.alvos = tuple(alvos or ())
+        else:
+            pendentes = frozenset(pendentes)
+            self.alvos = tuple(alvos) if alvos is not None else tuple(sorted(pendentes))
+        self._bit_alvo = {alvo: 1 << i for i, alvo in enumerate(self.alvos)}
+        mascara = pendentes if isinstance(pendentes, int) else self.mascara_alvos(pendentes)
+
+        super().__init__((x, y, bateria, mascara), goal)
         self.max_x, self.max_y = grid_limites 
         self.obstaculos = obstaculos 
         self.base = goal
+        self._altura = self.max_y + 1
+        # h memorizada por (x, y, alvos); a bateria não altera a estimativa.
+        self._h_cache = {}
+        self._dist_alvo_base = tuple(
+            abs(alvo_x - goal[0]) + abs(alvo_y - goal[1]) for alvo_x, alvo_y in self.alvos
+        )
+        # Manhattan entre todos os pares de (alvos..., base); a base é o
+        # último índice. Árvores geradoras mínimas memorizadas por máscara.
+        pontos = self.alvos + (goal,)
+        self._dist_pares = tuple(
+            tuple(abs(ax - bx) + abs(ay - by) for bx, by in pontos)
+            for ax, ay in pontos
+        )
+        self._mst_cache = {}
+        self._acoes_na_celula = [
+            self._acoes_legais(x, y)
+            for x in range(self.max_x + 1) for y in range(self._altura)
+        ]
 
-    def actions(self, state):
-        x, y, bateria, alvos = state
+    def mascara_alvos(self, coords):
+        mascara = 0
+        for coord in coords:
+            mascara |= self._bit_alvo[coord]
+        return mascara
+
+    def _acoes_legais(self, x, y):
         acoes_possiveis = []
-        
-        if bateria <= 0:
-            return acoes_possiveis
-            
         if x > 0 and (x - 1, y) not in self.obstaculos: acoes_possiveis.append('ESQUERDA')
         if x < self.max_x and (x + 1, y) not in self.obstaculos: acoes_possiveis.append('DIREITA')
         if y > 0 and (x, y - 1) not in self.obstaculos: acoes_possiveis.append('CIMA')
         if y < self.max_y and (x, y + 1) not in self.obstaculos: acoes_possiveis.append('BAIXO')
-        
-        return acoes_possiveis
+        return tuple(acoes_possiveis)
+
+    def actions(self, state):
+        if state[2] <= 0:
+            return ()
+        return self._acoes_na_celula[state[0] * self._altura + state[1]]
 
     def h(self, node):
         """
@@ -32,18 +76,56 @@ class SentinelaEstuarino(Problem):
         Calcula a Distância de Manhattan estimada até o objetivo.
         """
         x, y, bateria, alvos = node.state
+        chave = (x, y, alvos)
+        valor = self._h_cache.get(chave)
+        if valor is None:
+            valor = self._h_cache[chave] = self._h(x, y, alvos)
+        return valor
+
+    def _h(self, x, y, alvos):
         x_base, y_base = self.base
 
         if not alvos:
             return abs(x - x_base) + abs(y - y_base)
 
-        estimativas = []
-        for (alvo_x, alvo_y) in alvos:
-            dist_ate_alvo = abs(x - alvo_x) + abs(y - alvo_y)
-            dist_alvo_ate_base = abs(alvo_x - x_base) + abs(alvo_y - y_base)
-            estimativas.append(dist_ate_alvo + dist_alvo_ate_base)
+        # Distância alvo→base não depende do estado: vem pré-calculada.
+        mst = self._mst_cache.get(alvos)
+        if mst is None:
+            mst = self._mst_cache[alvos] = self._mst(alvos)
+        melhor = None
+        mais_proximo = None
+        while alvos:
+            bit = alvos & -alvos
+            alvos ^= bit
+            i = bit.bit_length() - 1
+            alvo_x, alvo_y = self.alvos[i]
+            distancia = abs(x - alvo_x) + abs(y - alvo_y)
+            estimativa = distancia + self._dist_alvo_base[i]
+            if melhor is None or estimativa < melhor:
+                melhor = estimativa
+            if mais_proximo is None or distancia < mais_proximo:
+                mais_proximo = distancia
+
+        # Todo percurso até a base passando pelos alvos pendentes vai até o
+        # alvo mais próximo e depois percorre um caminho que cobre alvos e
+        # base, que custa ao menos a árvore geradora mínima desses pontos.
+        return max(melhor, mais_proximo + mst)
 
-        return min(estimativas)
+    def _mst(self, alvos):
+        """Peso da árvore geradora mínima (Prim) dos alvos da máscara + base."""
+        dist = self._dist_pares
+        base = len(self.alvos)
+        fora = [i for i in range(base) if alvos >> i & 1]
+        custo = dict(zip(fora, (dist[base][i] for i in fora)))
+        total = 0
+        while custo:
+            i = min(custo, key=custo.get)
+            total += custo.pop(i)
+            linha = dist[i]
+            for j in custo:
+                if linha[j] < custo[j]:
+                    custo[j] = linha[j]
+        return total
 
     def result(self, state, action):
         x, y, bateria, alvos = state
@@ -54,10 +136,11 @@ class SentinelaEstuarino(Problem):
         elif action == 'CIMA': novo_y -= 1
         elif action == 'BAIXO': novo_y += 1
         
-        novos_alvos = alvos - frozenset({(novo_x, novo_y)})
+        novos_alvos = alvos & ~self._bit_alvo.get((novo_x, novo_y), 0)
         
         return (novo_x, novo_y, bateria - 1, novos_alvos)
 
     def goal_test(self, state):
-        x, y, bateria, alvos = state
-        return len(alvos) == 0 and (x, y) == self.base
\ No newline at end of file
+        if state[3]:
+            return False
+        return state[0] == self.base[0] and state[1] == self.base[1]
\ No newline at end of file
@@ -10,6 +10,7 @@ Script principal que integra todos os módulos seguindo a arquitetura SOLID:
 Uso:
     python main_autonomous.py
     python main_autonomous.py --simulacao
+    python main_autonomous.py --simulacao --silencioso   # sem log por passo
 """
 
 from __future__ import annotations
@@ -17,7 +18,9 @@ from __future__ import annotations
 import sys
 import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'aima-python'))
+_AIMA_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'aima-python'))
+if _AIMA_PATH not in sys.path:
+    sys.path.insert(0, _AIMA_PATH)
 
 from agents import Agent
 
@@ -26,10 +29,34 @@ from drone_agents.api_gateway import APIGateway
 from drone_agents.drone_agent import AutonomousDroneAgent
 
 
-def configurar_ambiente() -> tuple[
+# Mapa fixo do estuário: constantes compartilhadas (e nunca modificadas)
+# pelo ambiente, pelo agente e pelos problemas de busca de cada execução.
+ZONAS_URBANAS: frozenset[tuple[int, int]] = frozenset({
+    (6, 1), (7, 1),
+    (6, 2), (7, 2),
+    (5, 5), (5, 6),
+    (4, 6), (4, 7),
+    (1, 8), (2, 8), (3, 8),
+    (1, 9), (2, 9), (3, 9), (4, 9),
+    (7, 4), (8, 4), (9, 4),
+    (7, 5), (8, 5),
+    (9, 6), (9, 7),
+})
+
+OBSTACULOS: frozenset[tuple[int, int]] = frozenset({
+    (4, 2), (4, 3), (4, 4),
+    (5, 4), (6, 5),
+    (6, 6), (6, 7),
+    (8, 2),
+    (3, 6),
+    (9, 8),
+})
+
+
+def configurar_ambiente(verbose: bool = True) -> tuple[
     PoximEnvironment,
-    set[tuple[int, int]],
-    set[tuple[int, int]],
+    frozenset[tuple[int, int]],
+    frozenset[tuple[int, int]],
 ]:
     """
     Configura o ambiente estuarino do Rio Poxim.
@@ -38,27 +65,11 @@ def configurar_ambiente() -> tuple[
     - Obstáculos (mangues densos, pontes)
     - Zonas urbanas (áreas residenciais de Aracaju)
     - Base de operações (ponto de decolagem/pouso)
+
+    Com verbose=False o ambiente não imprime mensagens a cada ação.
     """
-    zonas_urbanas: set[tuple[int, int]] = {
-        (6, 1), (7, 1),
-        (6, 2), (7, 2),
-        (5, 5), (5, 6),
-        (4, 6), (4, 7),
-        (1, 8), (2, 8), (3, 8),
-        (1, 9), (2, 9), (3, 9), (4, 9),
-        (7, 4), (8, 4), (9, 4),
-        (7, 5), (8, 5),
-        (9, 6), (9, 7),
-    }
-
-    obstaculos: set[tuple[int, int]] = {
-        (4, 2), (4, 3), (4, 4),
-        (5, 4), (6, 5),           
-        (6, 6), (6, 7),           
-        (8, 2),                   
-        (3, 6),           
-        (9, 8),                
-    }
+    zonas_urbanas = ZONAS_URBANAS
+    obstaculos = OBSTACULOS
 
     env = PoximEnvironment(
         width=10,
@@ -66,6 +77,7 @@ def configurar_ambiente() -> tuple[
         zonas_urbanas=zonas_urbanas,
         base_position=(0, 0),
         battery_capacity=60,
+        verbose=verbose,
     )
 
     for pos in obstaculos:
@@ -74,8 +86,13 @@ def configurar_ambiente() -> tuple[
     return env, obstaculos, zonas_urbanas
 
 
-def executar_missao(usar_simulacao: bool = False) -> None:
-    """Executa a missão completa de monitoramento autônomo."""
+def executar_missao(usar_simulacao: bool = False, verbose: bool = True) -> None:
+    """
+    Executa a missão completa de monitoramento autônomo.
+
+    Com verbose=False ambiente, agente e laço de simulação não imprimem nada
+    por passo; cabeçalho, grids e relatório final continuam sendo exibidos.
+    """
 
     print("=" * 64)
     print("  🛰️  SISTEMA ADEMA-DRONE — Monitoramento do Rio Poxim")
@@ -83,10 +100,10 @@ def executar_missao(usar_simulacao: bool = False) -> None:
     print("=" * 64)
 
     print("\n🌊 Configurando ambiente estuarino...")
-    env, obstaculos, zonas_urbanas = configurar_ambiente()
+    env, obstaculos, zonas_urbanas = configurar_ambiente(verbose)
 
     print("📡 Inicializando comunicação com API de chamados...")
-    gateway = APIGateway(usar_simulacao=usar_simulacao)
+    gateway = APIGateway(usar_simulacao=usar_simulacao, verbose=verbose)
 
     print("🤖 Inicializando Drone Sentinela Autônomo...")
     drone_program = AutonomousDroneAgent(
@@ -96,6 +113,7 @@ def executar_missao(usar_simulacao: bool = False) -> None:
         zonas_urbanas=zonas_urbanas,
         base_position=(0, 0),
         battery_capacity=60,
+        verbose=verbose,
     )
 
     drone = Agent(drone_program)
@@ -119,13 +137,17 @@ def executar_missao(usar_simulacao: bool = False) -> None:
 
     max_steps = 200
     step = 0
+    separador = "─" * 40
 
     while not env.is_done() and step < max_steps:
         step += 1
-        print(f"\n{'─'*40}")
-        print(f"  Passo {step} | Posição: {drone.location} "
-              f"| Bateria: {env.get_battery(drone)}")
-        print(f"{'─'*40}")
+        if verbose:
+            sys.stdout.write(
+                f"\n{separador}\n"
+                f"  Passo {step} | Posição: {drone.location} "
+                f"| Bateria: {env.get_battery(drone)}\n"
+                f"{separador}\n"
+            )
 
         env.step()
 
@@ -133,6 +155,8 @@ def executar_missao(usar_simulacao: bool = False) -> None:
             print("\n⚠️  BATERIA ESGOTADA! Missão interrompida.")
             break
 
+    drone_program.finalize()
+
     print("\n" + "=" * 64)
     print("  📊 RELATÓRIO FINAL DA MISSÃO")
     print("=" * 64)
@@ -173,4 +197,6 @@ if __name__ == "__main__":
         print("ℹ️  Tentando conectar com API Flask em http://localhost:5000")
         print("   (Use --simulacao para executar sem a API)")
 
-    executar_missao(usar_simulacao=modo_simulacao)
+    silencioso = "--silencioso" in sys.argv or "--quiet" in sys.argv
+
+    executar_missao(usar_simulacao=modo_simulacao, verbose=not silencioso)
@@ -0,0 +1,409 @@
+"""
+problems/astar_numba.py — Kernel A* compilado para o grid do estuário
+
+Versão especializada do A* para a missão de um único alvo (base → alvo →
+base) sobre o grid uint8 de `construir_grid`. Toda a busca roda sobre
+arrays contíguos; com numba instalado a função é compilada em código
+nativo, sem numba ela executa o mesmo algoritmo em Python puro.
+
+Estado: (x, y, fase), com fase 1 = alvo pendente e fase 0 = retorno à base.
+A bateria não entra no estado: como cada passo consome exatamente o seu
+custo, bateria = bateria_inicial - g, e basta podar quando g > bateria.
+
+`a_star_rota` é a variante ponto a ponto usada pelo agente autônomo: devolve
+o plano como códigos de ação (índices de ACOES). Seu núcleo, `buscar_rota`,
+trabalha sobre arrays do chamador para que uma busca sem solução possa ser
+reaproveitada (`reconstruir_rota`) para outro destino.
+
+`a_star_alvos` generaliza a missão para vários alvos: o estado vira um
+único inteiro `(x * altura + y) << n_alvos | máscara`, como em
+`problems.solver.astar_grid`, e o laço inteiro do A* é compilado.
+"""
+
+from __future__ import annotations
+
+import heapq
+
+import numpy as np
+
+from problems.numba_compat import NUMBA_DISPONIVEL, njit
+from problems.search_problem import OBSTACULO, URBANO
+
+# Códigos de ação devolvidos por `a_star_rota`, na ordem de dxs/dys.
+ACOES: tuple[str, ...] = ("CIMA", "BAIXO", "ESQUERDA", "DIREITA")
+
+# `a_star_alvos` aloca 14 bytes por estado, com (largura * altura) << n_alvos
+# estados: o limite de ~4,2 milhões de estados fica em ≈ 59 MB.
+MAX_ESTADOS_COMPILADO: int = 1 << 22
+
+
+@njit(cache=True)
+def a_star_numba(
+    grid: np.ndarray, sx: int, sy: int, sbat: int, tx: int, ty: int
+) -> tuple[int, int, int]:
+    """
+    A* de (sx, sy) até o alvo (tx, ty) e de volta a (sx, sy).
+
+    Args:
+        grid (np.ndarray): Grid uint8 [x, y] com bits OBSTACULO | URBANO.
+        sx (int): Coordenada x da base (início e fim da missão).
+        sy (int): Coordenada y da base.
+        sbat (int): Bateria inicial; limita o custo total do caminho.
+        tx (int): Coordenada x do alvo.
+        ty (int): Coordenada y do alvo.
+
+    Returns:
+        tuple[int, int, int]: (custo, passos, nós expandidos); custo e
+            passos valem -1 quando não há solução.
+    """
+    largura, altura = grid.shape
+    infinito = np.int32(2 ** 30)
+    g = np.full((largura, altura, 2), infinito, dtype=np.int32)
+    pai = np.full((largura, altura, 2), -1, dtype=np.int32)
+    fechado = np.zeros((largura, altura, 2), dtype=np.bool_)
+    dxs = (0, 0, -1, 1)
+    dys = (-1, 1, 0, 0)
+    retorno_alvo = abs(tx - sx) + abs(ty - sy)
+
+    fase0 = 0 if (sx == tx and sy == ty) else 1
+    g[sx, sy, fase0] = 0
+    h0 = abs(sx - tx) + abs(sy - ty) + retorno_alvo if fase0 else 0
+    contador = 0
+    heap = [(h0, contador, sx, sy, fase0)]
+    nos_expandidos = 0
+
+    while len(heap) > 0:
+        _f, _c, x, y, fase = heapq.heappop(heap)
+        if fechado[x, y, fase]:
+            continue
+        fechado[x, y, fase] = True
+
+        if fase == 0 and x == sx and y == sy:
+            passos = 0
+            indice = pai[x, y, fase]
+            while indice >= 0:
+                passos += 1
+                px = indice // (altura * 2)
+                py = (indice // 2) % altura
+                indice = pai[px, py, indice % 2]
+            return int(g[x, y, fase]), passos, nos_expandidos
+
+        nos_expandidos += 1
+        g_atual = g[x, y, fase]
+        for k in range(4):
+            nx = x + dxs[k]
+            ny = y + dys[k]
+            if nx < 0 or ny < 0 or nx >= largura or ny >= altura:
+                continue
+            celula = grid[nx, ny]
+            if celula & OBSTACULO:
+                continue
+            novo_g = g_atual + (3 if celula & URBANO else 1)
+            if novo_g > sbat:
+                continue
+            nova_fase = 0 if (fase == 0 or (nx == tx and ny == ty)) else 1
+            if novo_g >= g[nx, ny, nova_fase]:
+                continue
+            g[nx, ny, nova_fase] = novo_g
+            pai[nx, ny, nova_fase] = (x * altura + y) * 2 + fase
+            if nova_fase:
+                h = abs(nx - tx) + abs(ny - ty) + retorno_alvo
+            else:
+                h = abs(nx - sx) + abs(ny - sy)
+            contador -= 1
+            heapq.heappush(heap, (novo_g + h, contador, nx, ny, nova_fase))
+
+    return -1, -1, nos_expandidos
+
+
+@njit(cache=True)
+def buscar_rota(
+    grid: np.ndarray,
+    sx: int,
+    sy: int,
+    sbat: int,
+    gx: int,
+    gy: int,
+    g: np.ndarray,
+    acao_pai: np.ndarray,
+    fechado: np.ndarray,
+) -> int:
+    """
+    Núcleo de `a_star_rota` sobre arrays fornecidos pelo chamador.
+
+    `g` deve vir preenchido com um valor maior que `sbat`, `acao_pai` com -1
+    e `fechado` com False. Se não houver solução, a busca esgota as células
+    alcançáveis com a bateria: `fechado` marca todas elas e `g` guarda o
+    custo ótimo de cada uma, o que permite reaproveitar a busca para outro
+    destino a partir da mesma origem (ver `reconstruir_rota`).
+
+    Returns:
+        int: Custo até (gx, gy), ou -1 quando não há solução.
+    """
+    largura, altura = grid.shape
+    dxs = (0, 0, -1, 1)
+    dys = (-1, 1, 0, 0)
+
+    g[sx, sy] = 0
+    contador = 0
+    heap = [(abs(sx - gx) + abs(sy - gy), contador, sx, sy)]
+
+    while len(heap) > 0:
+        _f, _c, x, y = heapq.heappop(heap)
+        if fechado[x, y]:
+            continue
+        fechado[x, y] = True
+
+        if x == gx and y == gy:
+            return int(g[x, y])
+
+        g_atual = g[x, y]
+        for k in range(4):
+            nx = x + dxs[k]
+            ny = y + dys[k]
+            if nx < 0 or ny < 0 or nx >= largura or ny >= altura:
+                continue
+            celula = grid[nx, ny]
+            if celula & OBSTACULO:
+                continue
+            novo_g = g_atual + (3 if celula & URBANO else 1)
+            if novo_g > sbat or novo_g >= g[nx, ny]:
+                continue
+            g[nx, ny] = novo_g
+            acao_pai[nx, ny] = k
+            contador -= 1
+            heapq.heappush(
+                heap, (novo_g + abs(nx - gx) + abs(ny - gy), contador, nx, ny)
+            )
+
+    return -1
+
+
+@njit(cache=True)
+def _h_alvos(
+    x: int,
+    y: int,
+    mascara: int,
+    alvos_x: np.ndarray,
+    alvos_y: np.ndarray,
+    bx: int,
+    by: int,
+) -> int:
+    """Manhattan até o alvo pendente mais próximo (contando a volta à base)."""
+    if mascara == 0:
+        return abs(x - bx) + abs(y - by)
+    melhor = 2 ** 30
+    for i in range(alvos_x.shape[0]):
+        if mascara >> i & 1:
+            estimativa = (
+                abs(x - alvos_x[i]) + abs(y - alvos_y[i])
+                + abs(alvos_x[i] - bx) + abs(alvos_y[i] - by)
+            )
+            if estimativa < melhor:
+                melhor = estimativa
+    return melhor
+
+
+@njit(cache=True)
+def _a_star_alvos_nucleo(
+    grid: np.ndarray,
+    sx: int,
+    sy: int,
+    sbat: int,
+    alvos_x: np.ndarray,
+    alvos_y: np.ndarray,
+    mascara0: int,
+    bx: int,
+    by: int,
+) -> tuple[int, int, np.ndarray]:
+    """Núcleo compilado de `a_star_alvos`, sem checagem de tamanho."""
+    largura, altura = grid.shape
+    n_bits = alvos_x.shape[0]
+    mascara_total = (1 << n_bits) - 1
+    n_estados = (largura * altura) << n_bits
+    g = np.full(n_estados, sbat + 1, dtype=np.int32)
+    pai = np.full(n_estados, -1, dtype=np.int64)
+    acao_pai = np.full(n_estados, -1, dtype=np.int8)
+    fechado = np.zeros(n_estados, dtype=np.bool_)
+    bit_da_celula = np.zeros(largura * altura, dtype=np.int64)
+    for i in range(n_bits):
+        bit_da_celula[alvos_x[i] * altura + alvos_y[i]] = 1 << i
+    dxs = (0, 0, -1, 1)
+    dys = (-1, 1, 0, 0)
+
+    inicio = (sx * altura + sy) << n_bits | mascara0
+    g[inicio] = 0
+    contador = 0
+    heap = [(_h_alvos(sx, sy, mascara0, alvos_x, alvos_y, bx, by), 0, contador, inicio)]
+    nos_expandidos = 0
+
+    while len(heap) > 0:
+        _f, _g, _c, estado = heapq.heappop(heap)
+        if fechado[estado]:
+            continue
+        fechado[estado] = True
+
+        celula = estado >> n_bits
+        mascara = estado & mascara_total
+        x = celula // altura
+        y = celula % altura
+
+        if mascara == 0 and x == bx and y == by:
+            passos = 0
+            indice = estado
+            while indice != inicio:
+                passos += 1
+                indice = pai[indice]
+            acoes = np.empty(passos, dtype=np.int8)
+            indice = estado
+            for i in range(passos - 1, -1, -1):
+                acoes[i] = acao_pai[indice]
+                indice = pai[indice]
+            return int(g[estado]), nos_expandidos, acoes
+
+        nos_expandidos += 1
+        g_atual = g[estado]
+        for k in range(4):
+            nx = x + dxs[k]
+            ny = y + dys[k]
+            if nx < 0 or ny < 0 or nx >= largura or ny >= altura:
+                continue
+            conteudo = grid[nx, ny]
+            if conteudo & OBSTACULO:
+                continue
+            novo_g = g_atual + (3 if conteudo & URBANO else 1)
+            if novo_g > sbat:
+                continue
+            vizinha = nx * altura + ny
+            nova_mascara = mascara & ~bit_da_celula[vizinha]
+            sucessor = vizinha << n_bits | nova_mascara
+            if fechado[sucessor] or novo_g >= g[sucessor]:
+                continue
+            g[sucessor] = novo_g
+            pai[sucessor] = estado
+            acao_pai[sucessor] = k
+            contador -= 1
+            h = _h_alvos(nx, ny, nova_mascara, alvos_x, alvos_y, bx, by)
+            heapq.heappush(heap, (novo_g + h, -novo_g, contador, sucessor))
+
+    return -1, nos_expandidos, np.empty(0, dtype=np.int8)
+
+
+def a_star_alvos(
+    grid: np.ndarray,
+    sx: int,
+    sy: int,
+    sbat: int,
+    alvos_x: np.ndarray,
+    alvos_y: np.ndarray,
+    mascara0: int,
+    bx: int,
+    by: int,
+) -> tuple[int, int, np.ndarray]:
+    """
+    A* de (sx, sy) visitando os alvos da máscara e terminando em (bx, by).
+
+    Args:
+        grid (np.ndarray): Grid uint8 [x, y] com bits OBSTACULO | URBANO.
+        sx (int): Coordenada x de partida.
+        sy (int): Coordenada y de partida.
+        sbat (int): Bateria inicial; limita o custo total do caminho.
+        alvos_x (np.ndarray): Coordenadas x dos alvos (bit i ↔ alvo i).
+        alvos_y (np.ndarray): Coordenadas y dos alvos.
+        mascara0 (int): Máscara dos alvos pendentes no início.
+        bx (int): Coordenada x da base.
+        by (int): Coordenada y da base.
+
+    Returns:
+        tuple[int, int, np.ndarray]: (custo, nós expandidos, ações int8 com
+            índices de ACOES); custo vale -1 e o array fica vazio quando
+            não há solução.
+
+    Raises:
+        ValueError: Se o espaço de estados passar de MAX_ESTADOS_COMPILADO.
+    """
+    largura, altura = grid.shape
+    n_bits = alvos_x.shape[0]
+    n_estados = (largura * altura) << n_bits
+    if n_estados > MAX_ESTADOS_COMPILADO:
+        raise ValueError(
+            f"a_star_alvos: {n_bits} alvos num grid {largura}×{altura} dão "
+            f"{n_estados} estados (máximo {MAX_ESTADOS_COMPILADO})"
+        )
+    return _a_star_alvos_nucleo(grid, sx, sy, sbat, alvos_x, alvos_y, mascara0, bx, by)
+
+
+@njit(cache=True)
+def reconstruir_rota(
+    acao_pai: np.ndarray, sx: int, sy: int, gx: int, gy: int
+) -> np.ndarray:
+    """Segue `acao_pai` de (gx, gy) até (sx, sy); devolve as ações em ordem."""
+    dxs = (0, 0, -1, 1)
+    dys = (-1, 1, 0, 0)
+    passos = 0
+    cx, cy = gx, gy
+    while cx != sx or cy != sy:
+        k = acao_pai[cx, cy]
+        cx -= dxs[k]
+        cy -= dys[k]
+        passos += 1
+    acoes = np.empty(passos, dtype=np.int8)
+    cx, cy = gx, gy
+    for i in range(passos - 1, -1, -1):
+        k = acao_pai[cx, cy]
+        acoes[i] = k
+        cx -= dxs[k]
+        cy -= dys[k]
+    return acoes
+
+
+def novos_arrays_rota(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Arrays (g, acao_pai, fechado) zerados para `buscar_rota`."""
+    return (
+        np.full(grid.shape, 2 ** 30, dtype=np.int32),
+        np.full(grid.shape, -1, dtype=np.int8),
+        np.zeros(grid.shape, dtype=np.bool_),
+    )
+
+
+def a_star_rota(
+    grid: np.ndarray, sx: int, sy: int, sbat: int, gx: int, gy: int
+) -> tuple[int, np.ndarray]:
+    """
+    A* de (sx, sy) até (gx, gy) com o mesmo modelo de custo e bateria.
+
+    Args:
+        grid (np.ndarray): Grid uint8 [x, y] com bits OBSTACULO | URBANO.
+        sx (int): Coordenada x de partida.
+        sy (int): Coordenada y de partida.
+        sbat (int): Bateria disponível; limita o custo total do caminho.
+        gx (int): Coordenada x do destino.
+        gy (int): Coordenada y do destino.
+
+    Returns:
+        tuple[int, np.ndarray]: (custo, ações int8 com índices de ACOES);
+            custo vale -1 e o array fica vazio quando não há solução.
+    """
+    g, acao_pai, fechado = novos_arrays_rota(grid)
+    custo = buscar_rota(grid, sx, sy, sbat, gx, gy, g, acao_pai, fechado)
+    if custo < 0:
+        return -1, np.empty(0, dtype=np.int8)
+    return custo, reconstruir_rota(acao_pai, sx, sy, gx, gy)
+
+
+def precompilar() -> None:
+    """
+    Compila (ou carrega do cache em disco) todos os kernels de uma vez.
+
+    Os kernels usam `cache=True`: a primeira chamada de cada um grava o
+    código nativo em `__pycache__` e execuções seguintes só o carregam.
+    Chamar esta função antes de uma bateria de testes ou benchmarks tira o
+    custo de compilação do tempo medido. Sem numba não faz nada.
+    """
+    if not NUMBA_DISPONIVEL:
+        return
+    grid = np.zeros((2, 2), dtype=np.uint8)
+    a_star_numba(grid, 0, 0, 4, 1, 1)
+    a_star_rota(grid, 0, 0, 4, 1, 1)
+    alvos = np.array([1], dtype=np.int64)
+    a_star_alvos(grid, 0, 0, 4, alvos, alvos, 1, 0, 0)
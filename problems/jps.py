@@ -0,0 +1,152 @@
+"""
+problems/jps.py — Jump Point Search em grid 4-conectado
+
+Variante de A* para mapas de custo uniforme (sem zonas urbanas): em vez de
+empilhar cada vizinho, a busca "salta" em linha reta e só insere na fila os
+pontos de salto, onde um caminho ótimo pode precisar virar.
+
+Ordem canônica horizontal-primeiro: deslocamentos horizontais têm os
+verticais como vizinhos naturais; deslocamentos verticais só viram para
+o lado quando o vizinho lateral é forçado (livre, mas bloqueado uma célula
+atrás). O plano final é subdividido em passos unitários.
+"""
+
+from __future__ import annotations
+
+import heapq
+
+import numpy as np
+
+from problems.search_problem import OBSTACULO
+
+_ACAO_POR_DIRECAO: dict[tuple[int, int], str] = {
+    (0, -1): "CIMA",
+    (0, 1): "BAIXO",
+    (-1, 0): "ESQUERDA",
+    (1, 0): "DIREITA",
+}
+
+
+def jps_rota(
+    grid: np.ndarray, sx: int, sy: int, sbat: int, gx: int, gy: int
+) -> list[str] | None:
+    """
+    Caminho mínimo de (sx, sy) até (gx, gy) por Jump Point Search.
+
+    Todas as células livres devem custar 1 (bits URBANO são ignorados);
+    o custo do caminho é o seu número de passos.
+
+    Args:
+        grid (np.ndarray): Grid uint8 [x, y] com o bit OBSTACULO.
+        sx (int): Coordenada x de partida.
+        sy (int): Coordenada y de partida.
+        sbat (int): Bateria disponível; limita o número de passos.
+        gx (int): Coordenada x do destino.
+        gy (int): Coordenada y do destino.
+
+    Returns:
+        list[str] | None: Ações do plano, ou None quando não há solução.
+    """
+    largura, altura = grid.shape
+    livre: list[list[bool]] = ((grid & OBSTACULO) == 0).tolist()
+
+    def aberto(x: int, y: int) -> bool:
+        return 0 <= x < largura and 0 <= y < altura and livre[x][y]
+
+    def saltar_vertical(x: int, y: int, dy: int) -> tuple[int, int] | None:
+        while True:
+            y += dy
+            if not aberto(x, y):
+                return None
+            if x == gx and y == gy:
+                return x, y
+            if (aberto(x - 1, y) and not aberto(x - 1, y - dy)) or (
+                aberto(x + 1, y) and not aberto(x + 1, y - dy)
+            ):
+                return x, y
+
+    def saltar_horizontal(x: int, y: int, dx: int) -> tuple[int, int] | None:
+        while True:
+            x += dx
+            if not aberto(x, y):
+                return None
+            if x == gx and y == gy:
+                return x, y
+            if saltar_vertical(x, y, 1) or saltar_vertical(x, y, -1):
+                return x, y
+
+    if not aberto(sx, sy):
+        return None
+
+    g: dict[tuple[int, int], int] = {(sx, sy): 0}
+    pai: dict[tuple[int, int], tuple[int, int]] = {}
+    fechado: set[tuple[int, int]] = set()
+    contador = 0
+    heap = [(abs(sx - gx) + abs(sy - gy), contador, sx, sy, 0, 0)]
+
+    while heap:
+        _f, _c, x, y, dx, dy = heapq.heappop(heap)
+        if (x, y) in fechado:
+            continue
+        fechado.add((x, y))
+
+        if x == gx and y == gy:
+            return _subdividir(pai, sx, sy, gx, gy)
+
+        if dx == 0 and dy == 0:
+            direcoes = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+        elif dx:
+            direcoes = [(dx, 0), (0, -1), (0, 1)]
+        else:
+            direcoes = [(0, dy)]
+            for lado in (-1, 1):
+                if aberto(x + lado, y) and not aberto(x + lado, y - dy):
+                    direcoes.append((lado, 0))
+
+        g_atual = g[(x, y)]
+        for ddx, ddy in direcoes:
+            if ddx:
+                ponto = saltar_horizontal(x, y, ddx)
+            else:
+                ponto = saltar_vertical(x, y, ddy)
+            if ponto is None or ponto in fechado:
+                continue
+            novo_g = g_atual + abs(ponto[0] - x) + abs(ponto[1] - y)
+            if novo_g > sbat or novo_g >= g.get(ponto, novo_g + 1):
+                continue
+            g[ponto] = novo_g
+            pai[ponto] = (x, y)
+            contador -= 1
+            heapq.heappush(
+                heap,
+                (
+                    novo_g + abs(ponto[0] - gx) + abs(ponto[1] - gy),
+                    contador,
+                    ponto[0],
+                    ponto[1],
+                    ddx,
+                    ddy,
+                ),
+            )
+
+    return None
+
+
+def _subdividir(
+    pai: dict[tuple[int, int], tuple[int, int]],
+    sx: int,
+    sy: int,
+    gx: int,
+    gy: int,
+) -> list[str]:
+    """Converte a cadeia de pontos de salto em ações unitárias."""
+    pontos = [(gx, gy)]
+    while pontos[-1] != (sx, sy):
+        pontos.append(pai[pontos[-1]])
+    pontos.reverse()
+
+    acoes: list[str] = []
+    for (x1, y1), (x2, y2) in zip(pontos, pontos[1:]):
+        passo = ((x2 > x1) - (x2 < x1), (y2 > y1) - (y2 < y1))
+        acoes.extend([_ACAO_POR_DIRECAO[passo]] * (abs(x2 - x1) + abs(y2 - y1)))
+    return acoes
@@ -0,0 +1,21 @@
+"""
+problems/numba_compat.py — numba opcional
+
+Ponto único de importação do `njit`: com numba instalado é o decorador
+real; sem numba, um substituto que devolve a função Python sem compilar.
+`NUMBA_DISPONIVEL` indica qual dos dois está em uso.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+    NUMBA_DISPONIVEL = True
+except ImportError:
+    NUMBA_DISPONIVEL = False
+
+    def njit(*args, **kwargs):
+        """Substituto sem compilação quando numba não está instalado."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda funcao: funcao
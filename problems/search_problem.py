@@ -9,21 +9,94 @@ Classe PollutionMappingProblem herda de search.Problem (AIMA) e modela
 o problema de navegação do drone no estuário do Rio Poxim como um
 problema de busca em espaço de estados.
 
-Estado: (pos_x, pos_y, battery, frozenset(targets_pending))
+Estado: (pos_x, pos_y, battery, targets_mask)
+    targets_mask é um inteiro onde o bit i marca o alvo i como pendente.
 Ações: CIMA, BAIXO, ESQUERDA, DIREITA
 Heurística: Manhattan com ajuste de Vento Atlântico
 Custo: Base 1 + Urban Penalty (3× em zonas urbanas)
+Mapa: grid uint8 em que cada célula guarda os bits OBSTACULO | URBANO
 """
 
 from __future__ import annotations
 
 import sys
 import os
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'aima-python'))
+import numpy as np
+
+_AIMA_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'aima-python'))
+if _AIMA_PATH not in sys.path:
+    sys.path.insert(0, _AIMA_PATH)
 
 from search import Problem
 
+OBSTACULO: int = 1
+URBANO: int = 2
+
+
+def construir_grid(
+    grid_size: tuple[int, int],
+    obstaculos: Iterable[tuple[int, int]] = (),
+    zonas_urbanas: Iterable[tuple[int, int]] = (),
+) -> np.ndarray:
+    """
+    Empacota obstáculos e zonas urbanas em um grid uint8 indexado por [x, y].
+
+    Args:
+        grid_size (tuple[int, int]): Dimensões (largura, altura) do grid.
+        obstaculos (Iterable[tuple[int, int]]): Células bloqueadas.
+        zonas_urbanas (Iterable[tuple[int, int]]): Células com Urban Penalty.
+
+    Returns:
+        np.ndarray: Grid de shape `grid_size` com os bits OBSTACULO e URBANO.
+    """
+    grid = np.zeros(grid_size, dtype=np.uint8)
+    for x, y in obstaculos:
+        grid[x, y] |= OBSTACULO
+    for x, y in zonas_urbanas:
+        grid[x, y] |= URBANO
+    return grid
+
+
+@lru_cache(maxsize=64)
+def _tabelas_do_grid(
+    largura: int,
+    altura: int,
+    dados: bytes,
+) -> tuple[list[int], list[tuple[str, ...]], list[tuple[tuple[str, int, int, int], ...]]]:
+    """
+    Tabelas por célula (índice x * altura + y) de um grid, em cache por
+    conteúdo: quem monta um problema por consulta sobre o mesmo mapa não
+    refaz os laços O(largura × altura).
+
+    Returns:
+        tuple: (células, ações legais, sucessores). Os sucessores são as
+        tuplas (ação, novo_x, novo_y, custo) das ações legais, com o Urban
+        Penalty da célula de destino já resolvido. As listas são
+        compartilhadas e não devem ser alteradas.
+    """
+    celulas: list[int] = list(dados)
+    acoes_na_celula: list[tuple[str, ...]] = []
+    sucessores_na_celula: list[tuple[tuple[str, int, int, int], ...]] = []
+    for x in range(largura):
+        for y in range(altura):
+            i = x * altura + y
+            sucessores = []
+            for acao, nx, ny, vizinho, valido in (
+                ("CIMA", x, y - 1, i - 1, y > 0),
+                ("BAIXO", x, y + 1, i + 1, y < altura - 1),
+                ("ESQUERDA", x - 1, y, i - altura, x > 0),
+                ("DIREITA", x + 1, y, i + altura, x < largura - 1),
+            ):
+                if valido and not celulas[vizinho] & OBSTACULO:
+                    custo = 3 if celulas[vizinho] & URBANO else 1
+                    sucessores.append((acao, nx, ny, custo))
+            acoes_na_celula.append(tuple(acao for acao, *_ in sucessores))
+            sucessores_na_celula.append(tuple(sucessores))
+    return celulas, acoes_na_celula, sucessores_na_celula
+
 
 class PollutionMappingProblem(Problem):
     """
@@ -36,58 +109,156 @@ class PollutionMappingProblem(Problem):
     O espaço de estados é definido por:
         - Posição (x, y) no grid discretizado
         - Nível de bateria restante
-        - Conjunto de alvos (pontos de coleta) pendentes
+        - Máscara de bits dos alvos (pontos de coleta) pendentes
+
+    O quarto componente de `initial` pode ser um iterável de coordenadas
+    (convertido aqui para máscara) ou já uma máscara inteira; neste caso,
+    `alvos` define a ordem dos bits (bit i ↔ alvos[i]). Uma tupla de
+    coordenadas deve vir ordenada e sem repetições.
+
+    O mapa pode ser passado pronto em `grid` (ver `construir_grid`); caso
+    contrário é montado a partir de `obstaculos` e `zonas_urbanas`.
     """
 
+    # search.Problem não declara __slots__: `initial` e `goal` continuam no
+    # __dict__; os atributos próprios ficam em slots.
+    __slots__ = (
+        "alvos",
+        "_bit_alvo",
+        "_alvos_x",
+        "_alvos_y",
+        "_tabelas_h",
+        "base",
+        "max_x",
+        "max_y",
+        "obstaculos",
+        "zonas_urbanas",
+        "grid",
+        "_altura",
+        "_celulas",
+        "_acoes_na_celula",
+        "_sucessores_na_celula",
+        "vento_atlantico",
+        "fator_vento",
+    )
+
     def __init__(
         self,
-        initial: tuple[int, int, int, frozenset[tuple[int, int]]],
+        initial: tuple[int, int, int, int | Iterable[tuple[int, int]]],
         goal: tuple[int, int],
         grid_size: tuple[int, int] = (10, 10),
         obstaculos: set[tuple[int, int]] | None = None,
         zonas_urbanas: set[tuple[int, int]] | None = None,
         vento_atlantico: str = "leste",
         fator_vento: float = 1.5,
+        alvos: Sequence[tuple[int, int]] | None = None,
+        grid: np.ndarray | None = None,
     ) -> None:
-        super().__init__(initial, goal)
+        self.redefinir(initial, goal, alvos)
         self.max_x: int = grid_size[0] - 1
         self.max_y: int = grid_size[1] - 1
-        self.obstaculos: set[tuple[int, int]] = obstaculos or set()
-        self.zonas_urbanas: set[tuple[int, int]] = zonas_urbanas or set()
-        self.base: tuple[int, int] = goal
+        if grid is None:
+            grid = construir_grid(grid_size, obstaculos or (), zonas_urbanas or ())
+        if obstaculos is None:
+            obstaculos = {(int(x), int(y)) for x, y in np.argwhere(grid & OBSTACULO)}
+        if zonas_urbanas is None:
+            zonas_urbanas = {(int(x), int(y)) for x, y in np.argwhere(grid & URBANO)}
+        self.obstaculos: set[tuple[int, int]] = obstaculos
+        self.zonas_urbanas: set[tuple[int, int]] = zonas_urbanas
+        self.grid: np.ndarray = grid
+        # Cópia achatada (índice x * altura + y) para as consultas célula a
+        # célula feitas em Python puro; indexar o ndarray escalar é mais lento.
+        # As tabelas são compartilhadas entre instâncias com o mesmo mapa.
+        self._altura: int = grid_size[1]
+        self._celulas, self._acoes_na_celula, self._sucessores_na_celula = (
+            _tabelas_do_grid(
+                grid_size[0], grid_size[1], grid.astype(np.uint8, copy=False).tobytes()
+            )
+        )
         self.vento_atlantico: str = vento_atlantico
         self.fator_vento: float = fator_vento
 
-    def actions(self, state: tuple) -> list[str]:
+    def redefinir(
+        self,
+        initial: tuple[int, int, int, int | Iterable[tuple[int, int]]],
+        goal: tuple[int, int],
+        alvos: Sequence[tuple[int, int]] | None = None,
+    ) -> None:
         """
-        Retorna ações possíveis dado o estado atual.
-        Verifica limites do grid, obstáculos e bateria disponível.
-        O agente não pode se mover se a bateria estiver zerada.
+        Troca estado inicial, objetivo e alvos mantendo o mapa.
+
+        Permite reaproveitar a mesma instância entre ciclos de planejamento:
+        grid, `_celulas` e obstáculos não mudam, só o que depende dos alvos.
         """
-        x, y, bateria, alvos = state
-        acoes: list[str] = []
+        x, y, bateria, alvos_iniciais = initial
+        if isinstance(alvos_iniciais, int):
+            self.alvos: tuple[tuple[int, int], ...] = tuple(alvos or ())
+            mascara = alvos_iniciais
+        elif isinstance(alvos_iniciais, tuple) and alvos is None:
+            # Tupla ordenada e sem repetições: já está na ordem dos bits.
+            self.alvos = alvos_iniciais
+            mascara = (1 << len(alvos_iniciais)) - 1
+        else:
+            alvos_iniciais = frozenset(alvos_iniciais)
+            self.alvos = tuple(alvos) if alvos is not None else tuple(sorted(alvos_iniciais))
+            mascara = None
+        self._bit_alvo: dict[tuple[int, int], int] = {
+            alvo: 1 << i for i, alvo in enumerate(self.alvos)
+        }
+        if mascara is None:
+            mascara = self.mascara_alvos(alvos_iniciais)
+        # Coordenadas dos alvos em colunas (bit i ↔ posição i), para as
+        # tabelas heurísticas selecionarem os pendentes por índice.
+        self._alvos_x: np.ndarray = np.array(
+            [alvo[0] for alvo in self.alvos], dtype=np.int32
+        )
+        self._alvos_y: np.ndarray = np.array(
+            [alvo[1] for alvo in self.alvos], dtype=np.int32
+        )
 
-        if bateria <= 0:
-            return acoes
+        super().__init__((x, y, bateria, mascara), goal)
+        self._tabelas_h: dict[int, list[float]] = {}
+        self.base: tuple[int, int] = goal
 
-        if y > 0 and (x, y - 1) not in self.obstaculos:
-            acoes.append("CIMA")
-        if y < self.max_y and (x, y + 1) not in self.obstaculos:
-            acoes.append("BAIXO")
-        if x > 0 and (x - 1, y) not in self.obstaculos:
-            acoes.append("ESQUERDA")
-        if x < self.max_x and (x + 1, y) not in self.obstaculos:
-            acoes.append("DIREITA")
+    def mascara_alvos(self, coords: Iterable[tuple[int, int]]) -> int:
+        """Converte um conjunto de coordenadas de alvos em máscara de bits."""
+        mascara = 0
+        for coord in coords:
+            mascara |= self._bit_alvo[coord]
+        return mascara
 
-        return acoes
+    def actions(self, state: tuple) -> tuple[str, ...]:
+        """
+        Retorna ações possíveis dado o estado atual.
+        Limites do grid e obstáculos já vêm resolvidos na tabela por
+        célula; aqui só se verifica a bateria disponível.
+        O agente não pode se mover se a bateria estiver zerada.
+        """
+        if state[2] <= 0:
+            return ()
+        return self._acoes_na_celula[state[0] * self._altura + state[1]]
 
     def result(self, state: tuple, action: str) -> tuple:
         """
         Retorna o estado resultante de executar a ação.
         Atualiza posição, consome bateria (com Urban Penalty se aplicável),
         e remove alvos visitados do conjunto pendente.
+
+        Movimentos legais vêm da tabela de sucessores da célula; os demais
+        (para obstáculo, para fora do grid ou partindo de fora dele) caem no
+        cálculo direto abaixo, em que uma célula fora do grid custa 1.
         """
         x, y, bateria, alvos = state
+        if 0 <= x <= self.max_x and 0 <= y <= self.max_y:
+            for acao, novo_x, novo_y, custo in self._sucessores_na_celula[x * self._altura + y]:
+                if acao == action:
+                    return (
+                        novo_x,
+                        novo_y,
+                        bateria - custo,
+                        alvos & ~self._bit_alvo.get((novo_x, novo_y), 0),
+                    )
+
         novo_x, novo_y = x, y
 
         if action == "CIMA":
@@ -99,26 +270,48 @@ class PollutionMappingProblem(Problem):
         elif action == "DIREITA":
             novo_x += 1
 
-        custo = 3 if (novo_x, novo_y) in self.zonas_urbanas else 1
+        custo = self._custo_passo(novo_x, novo_y)
 
-        novos_alvos = alvos - frozenset({(novo_x, novo_y)})
+        novos_alvos = alvos & ~self._bit_alvo.get((novo_x, novo_y), 0)
 
         return (novo_x, novo_y, bateria - custo, novos_alvos)
 
+    def _custo_passo(self, x: int, y: int) -> int:
+        """Custo de entrar em (x, y): 3 em zona urbana, 1 fora dela ou do grid."""
+        if 0 <= x <= self.max_x and 0 <= y <= self.max_y:
+            if self._celulas[x * self._altura + y] & URBANO:
+                return 3
+        return 1
+
+    def successors(self, state: tuple) -> list[tuple[str, tuple, int]]:
+        """
+        `actions` e `result` fundidos: (ação, novo estado, custo do passo)
+        para cada ação legal, desempacotando o estado uma única vez.
+        """
+        x, y, bateria, alvos = state
+        if bateria <= 0:
+            return []
+        bit_alvo = self._bit_alvo
+        return [
+            (acao, (nx, ny, bateria - custo, alvos & ~bit_alvo.get((nx, ny), 0)), custo)
+            for acao, nx, ny, custo in self._sucessores_na_celula[x * self._altura + y]
+        ]
+
     def goal_test(self, state: tuple) -> bool:
         """
         Verifica se o estado é um objetivo.
         O objetivo é atingido quando:
-        1. Todos os alvos foram coletados (frozenset vazio)
+        1. Todos os alvos foram coletados (máscara zerada)
         2. O drone retornou à posição da base
         3. A bateria é suficiente (>= 0) para confirmar pouso seguro
+
+        Quase todo estado gerado ainda tem alvos pendentes: a máscara é
+        testada antes de qualquer outro campo.
         """
-        x, y, bateria, alvos = state
-        return (
-            len(alvos) == 0
-            and (x, y) == self.base
-            and bateria >= 0
-        )
+        if state[3]:
+            return False
+        x_base, y_base = self.base
+        return state[0] == x_base and state[1] == y_base and state[2] >= 0
 
     def path_cost(
         self,
@@ -132,42 +325,72 @@ class PollutionMappingProblem(Problem):
         Integra o Urban Penalty: movimentos em zonas urbanas
         custam 3× mais que em áreas naturais.
         """
-        x2, y2, _, _ = state2
-        custo_passo = 3 if (x2, y2) in self.zonas_urbanas else 1
-        return c + custo_passo
+        return c + self._custo_passo(state2[0], state2[1])
 
-    def h(self, node) -> float:
+    def tabela_heuristica(self, alvos: int) -> np.ndarray:
         """
-        Função heurística admissível com ajuste de Vento Atlântico.
-        Calcula a distância de Manhattan estimada considerando a distância até o alvo e base, 
-        e penaliza movimentos contra o vento (LESTE/OESTE).
+        Tabela h[x, y] para todas as células, dada a máscara de alvos pendentes.
+
+        Mesma estimativa de `h()` (Manhattan com ajuste de Vento Atlântico),
+        calculada de uma vez para o grid inteiro.
+
+        Args:
+            alvos (int): Máscara de bits dos alvos pendentes.
+
+        Returns:
+            np.ndarray: Array float64 de shape (largura, altura).
         """
-        x, y, bateria, alvos = node.state
+        xs = np.arange(self.max_x + 1, dtype=np.float64)[:, np.newaxis]
+        ys = np.arange(self.max_y + 1, dtype=np.float64)[np.newaxis, :]
         x_base, y_base = self.base
+        # Sentido contra o vento: +1 indo para leste, -1 indo para oeste.
+        sinal = {"leste": 1, "oeste": -1}.get(self.vento_atlantico, 0)
+        fator = self.fator_vento
 
-        def _manhattan_com_vento(
-            x1: int, y1: int, x2: int, y2: int
-        ) -> float:
-            dx = abs(x1 - x2)
-            dy = abs(y1 - y2)
+        if not alvos:
+            dx = np.abs(xs - x_base)
+            if sinal:
+                dx = np.where(sinal * (x_base - xs) > 0, dx * fator, dx)
+            return dx + np.abs(ys - y_base)
 
-            penalidade_x = dx
-            if self.vento_atlantico == "leste" and x2 > x1:
-                penalidade_x = dx * self.fator_vento
-            elif self.vento_atlantico == "oeste" and x2 < x1:
-                penalidade_x = dx * self.fator_vento
+        # Alvos pendentes no primeiro eixo: (n, 1, 1) contra o grid (1, W) × (H).
+        pendentes = [i for i in range(len(self.alvos)) if alvos >> i & 1]
+        alvo_x = self._alvos_x[pendentes][:, np.newaxis, np.newaxis]
+        alvo_y = self._alvos_y[pendentes][:, np.newaxis, np.newaxis]
 
-            return penalidade_x + dy
+        dx = np.abs(xs - alvo_x)
+        dx_base = np.abs(alvo_x - x_base)
+        if sinal:
+            dx = np.where(sinal * (alvo_x - xs) > 0, dx * fator, dx)
+            dx_base = np.where(sinal * (x_base - alvo_x) > 0, dx_base * fator, dx_base)
+        dist_alvo_base = dx_base + np.abs(alvo_y - y_base)
+        tabela = (dx + np.abs(ys - alvo_y) + dist_alvo_base).min(axis=0)
 
-        if not alvos:
-            return _manhattan_com_vento(x, y, x_base, y_base)
+        return tabela
 
-        estimativas: list[float] = []
-        for alvo_x, alvo_y in alvos:
-            dist_ate_alvo = _manhattan_com_vento(x, y, alvo_x, alvo_y)
-            dist_alvo_base = _manhattan_com_vento(
-                alvo_x, alvo_y, x_base, y_base
-            )
-            estimativas.append(dist_ate_alvo + dist_alvo_base)
+    def h(self, node) -> float:
+        """
+        Função heurística admissível com ajuste de Vento Atlântico.
+        Calcula a distância de Manhattan estimada considerando a distância até o alvo e base, 
+        e penaliza movimentos contra o vento (LESTE/OESTE).
 
-        return min(estimativas)
+        A tabela de cada máscara é gerada uma única vez por
+        `tabela_heuristica()` e consultada por índice nas chamadas seguintes.
+        """
+        x, y, _, alvos = node.state
+        tabela = self._tabelas_h.get(alvos)
+        if tabela is None:
+            tabela = self._tabelas_h[alvos] = self._tabela_h_lista(alvos)
+        return tabela[x * self._altura + y]
+
+    def _tabela_h_lista(self, alvos: int) -> list[float] | list[int]:
+        """
+        `tabela_heuristica` achatada em lista; quando todos os valores são
+        inteiros (sem vento ou fator inteiro) a lista é de int, e f = g + h
+        segue em aritmética inteira na fila de prioridade.
+        """
+        tabela = self.tabela_heuristica(alvos).ravel()
+        inteira = tabela.astype(np.int64)
+        if np.array_equal(inteira, tabela):
+            return inteira.tolist()
+        return tabela.tolist()
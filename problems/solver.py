@@ -0,0 +1,263 @@
+"""
+problems/solver.py — A* com estados codificados em inteiros
+
+Resolve um PollutionMappingProblem sem criar objetos Node: cada estado
+(x, y, máscara de alvos) vira um único int, a fila de prioridade guarda
+tuplas (f, desempate, estado) e pais/ações ficam em dicts indexados pelo
+int. A bateria não precisa entrar no estado: bateria = inicial - g.
+Empates em f são resolvidos pelo maior g (como `busca_a_estrela` em
+analise_algoritmos.py) e, depois, pelo nó inserido por último.
+
+Usa a mesma heurística do problema (`tabela_heuristica`), de modo que o
+resultado coincide com o `astar_search` do AIMA. `astar_compilado`
+resolve o mesmo problema com o kernel `a_star_alvos` (numba), usando a
+heurística Manhattan sem ajuste de vento.
+
+Quando f = g + h é inteiro (sem vento ou com fator de vento inteiro),
+`astar_bucket` troca o heap por uma fila de baldes indexada por f; as duas
+fronteiras retiram os estados na mesma ordem e o laço de expansão
+(`_astar_inteiro`) é o mesmo.
+"""
+
+from __future__ import annotations
+
+import heapq
+
+import numpy as np
+
+from problems.astar_numba import ACOES, a_star_alvos
+from problems.search_problem import OBSTACULO, URBANO, PollutionMappingProblem
+
+# (ação, dx, dy), na mesma ordem de PollutionMappingProblem.actions
+_MOVIMENTOS: tuple[tuple[str, int, int], ...] = (
+    ("CIMA", 0, -1),
+    ("BAIXO", 0, 1),
+    ("ESQUERDA", -1, 0),
+    ("DIREITA", 1, 0),
+)
+
+
+class _FilaHeap:
+    """Fronteira em heap de (f, -g, contador decrescente, estado)."""
+
+    __slots__ = ("_heap", "_contador")
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, int, int]] = []
+        self._contador = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def inserir(self, f: float, g: int, estado: int) -> None:
+        self._contador -= 1
+        heapq.heappush(self._heap, (f, -g, self._contador, estado))
+
+    def retirar(self) -> int:
+        return heapq.heappop(self._heap)[3]
+
+
+class _FilaBaldes:
+    """
+    Fronteira em baldes (bucket queue) para f inteiro.
+
+    `baldes[f]` separa os estados em sub-baldes por g; retira-se do menor f,
+    maior g e, dentro do sub-balde, o último inserido (LIFO), a mesma ordem
+    de `_FilaHeap`. Um cursor avança até o próximo balde não vazio.
+    """
+
+    __slots__ = ("_baldes", "_cursor", "_pendentes")
+
+    def __init__(self) -> None:
+        self._baldes: list[dict[int, list[int]]] = []
+        self._cursor = 0
+        self._pendentes = 0
+
+    def __bool__(self) -> bool:
+        return self._pendentes > 0
+
+    def inserir(self, f: int, g: int, estado: int) -> None:
+        baldes = self._baldes
+        if f >= len(baldes):
+            baldes.extend({} for _ in range(f + 1 - len(baldes)))
+        baldes[f].setdefault(g, []).append(estado)
+        self._pendentes += 1
+        # Heurística inconsistente pode gerar f abaixo do cursor.
+        if f < self._cursor:
+            self._cursor = f
+
+    def retirar(self) -> int:
+        baldes = self._baldes
+        while not baldes[self._cursor]:
+            self._cursor += 1
+        balde = baldes[self._cursor]
+        g = max(balde)
+        estados = balde[g]
+        estado = estados.pop()
+        if not estados:
+            del balde[g]
+        self._pendentes -= 1
+        return estado
+
+
+def _astar_inteiro(
+    problem: PollutionMappingProblem,
+    fila: _FilaHeap | _FilaBaldes,
+    h_inteira: bool,
+) -> tuple[list[str] | None, int, int]:
+    """
+    Laço de A* sobre estados inteiros `(x * altura + y) << n_alvos | máscara`,
+    com a fronteira dada por `fila`. Com `h_inteira` a tabela heurística é
+    convertida para int (exigido por `_FilaBaldes`).
+    """
+    x0, y0, bateria0, mascara0 = problem.initial
+    largura = problem.max_x + 1
+    altura = problem.max_y + 1
+    n_bits = len(problem.alvos)
+    mascara_total = (1 << n_bits) - 1
+    celulas: list[int] = problem.grid.ravel().tolist()
+    base = problem.base[0] * altura + problem.base[1]
+    bit_da_celula = {
+        x * altura + y: 1 << i for i, (x, y) in enumerate(problem.alvos)
+    }
+    tabelas: dict[int, list[float] | list[int]] = {}
+
+    def h(celula: int, mascara: int) -> float:
+        tabela = tabelas.get(mascara)
+        if tabela is None:
+            tabela = problem.tabela_heuristica(mascara).ravel()
+            if h_inteira:
+                tabela = tabela.astype(np.int64)
+            tabela = tabelas[mascara] = tabela.tolist()
+        return tabela[celula]
+
+    inicio = (x0 * altura + y0) << n_bits | mascara0
+    g: dict[int, int] = {inicio: 0}
+    pai: dict[int, int] = {}
+    acao: dict[int, str] = {}
+    fechado: set[int] = set()
+    fila.inserir(h(inicio >> n_bits, mascara0), 0, inicio)
+    nos_expandidos = 0
+
+    while fila:
+        estado = fila.retirar()
+        if estado in fechado:
+            continue
+        fechado.add(estado)
+
+        celula = estado >> n_bits
+        mascara = estado & mascara_total
+        g_atual = g[estado]
+
+        if not mascara and celula == base:
+            acoes: list[str] = []
+            while estado != inicio:
+                acoes.append(acao[estado])
+                estado = pai[estado]
+            acoes.reverse()
+            return acoes, g_atual, nos_expandidos
+
+        nos_expandidos += 1
+        if g_atual >= bateria0:
+            continue
+
+        x, y = divmod(celula, altura)
+        for nome, dx, dy in _MOVIMENTOS:
+            nx = x + dx
+            ny = y + dy
+            if nx < 0 or ny < 0 or nx >= largura or ny >= altura:
+                continue
+            vizinha = nx * altura + ny
+            conteudo = celulas[vizinha]
+            if conteudo & OBSTACULO:
+                continue
+            novo_g = g_atual + (3 if conteudo & URBANO else 1)
+            if novo_g > bateria0:
+                continue
+            nova_mascara = mascara & ~bit_da_celula.get(vizinha, 0)
+            sucessor = vizinha << n_bits | nova_mascara
+            if sucessor in fechado or novo_g >= g.get(sucessor, novo_g + 1):
+                continue
+            g[sucessor] = novo_g
+            pai[sucessor] = estado
+            acao[sucessor] = nome
+            fila.inserir(novo_g + h(vizinha, nova_mascara), novo_g, sucessor)
+
+    return None, -1, nos_expandidos
+
+
+def astar_grid(
+    problem: PollutionMappingProblem,
+) -> tuple[list[str] | None, int, int]:
+    """
+    A* sobre estados inteiros `(x * altura + y) << n_alvos | máscara`.
+
+    Args:
+        problem (PollutionMappingProblem): Problema a resolver.
+
+    Returns:
+        tuple[list[str] | None, int, int]: (ações, custo, nós expandidos);
+            ações é None e custo -1 quando não há solução.
+    """
+    return _astar_inteiro(problem, _FilaHeap(), h_inteira=False)
+
+
+def astar_compilado(
+    problem: PollutionMappingProblem,
+) -> tuple[list[str] | None, int, int]:
+    """
+    Resolve o problema com o A* compilado de `a_star_alvos`.
+
+    Args:
+        problem (PollutionMappingProblem): Problema a resolver.
+
+    Returns:
+        tuple[list[str] | None, int, int]: (ações, custo, nós expandidos);
+            ações é None e custo -1 quando não há solução.
+
+    Raises:
+        ValueError: Se o espaço de estados passar de `MAX_ESTADOS_COMPILADO`.
+    """
+    x0, y0, bateria0, mascara0 = problem.initial
+    alvos = np.array(problem.alvos, dtype=np.int64).reshape(-1, 2)
+    custo, nos_expandidos, codigos = a_star_alvos(
+        problem.grid,
+        x0,
+        y0,
+        bateria0,
+        alvos[:, 0].copy(),
+        alvos[:, 1].copy(),
+        mascara0,
+        problem.base[0],
+        problem.base[1],
+    )
+    if custo < 0:
+        return None, -1, nos_expandidos
+    return [ACOES[k] for k in codigos], custo, nos_expandidos
+
+
+def astar_bucket(
+    problem: PollutionMappingProblem,
+) -> tuple[list[str] | None, int, int]:
+    """
+    `astar_grid` com fila de prioridade em baldes (bucket queue).
+
+    Custos de passo (1 ou 3) e heurística são inteiros, então f = g + h
+    indexa diretamente uma lista de baldes; inserir custa O(1) e um cursor
+    avança até o próximo balde não vazio. Os empates seguem a ordem de
+    `astar_grid` (maior g, depois o último inserido), de modo que as duas
+    expandem os mesmos nós. Com fator de vento fracionário a heurística não
+    é inteira e a busca é delegada a `astar_grid`.
+
+    Args:
+        problem (PollutionMappingProblem): Problema a resolver.
+
+    Returns:
+        tuple[list[str] | None, int, int]: (ações, custo, nós expandidos);
+            ações é None e custo -1 quando não há solução.
+    """
+    if problem.vento_atlantico in ("leste", "oeste") and not float(
+        problem.fator_vento
+    ).is_integer():
+        return astar_grid(problem)
+    return _astar_inteiro(problem, _FilaBaldes(), h_inteira=True)
@@ -1,22 +1,43 @@
-import subprocess
+import importlib.util
 import sys
 
+import pytest
+
+# Um worker por núcleo; cada arquivo de teste roda inteiro num só worker.
+# O plugin só é localizado, não importado: pytest.main o carrega e reescreve
+# as asserções dele.
+if importlib.util.find_spec("xdist") is not None:
+    PYTEST_PARALELO = ["-n", "auto", "--dist=loadfile"]
+else:
+    PYTEST_PARALELO = []
+
 
 def run_all():
+    # Tudo roda no mesmo interpretador: sem custo de inicialização do Python
+    # nem reimportação do AIMA/numpy a cada etapa.
+
+    # Compila os kernels numba (ou carrega do cache) antes da suíte, para
+    # que o JIT não pese no primeiro teste que os usa
+    from problems.astar_numba import precompilar
+    precompilar()
+
     # Executa a suíte de testes
-    rc = subprocess.call([sys.executable, "-m", "pytest", "tests/", "-q"]) 
+    # (em paralelo quando pytest-xdist está instalado)
+    rc = pytest.main(["tests/", "-q", *PYTEST_PARALELO])
     if rc != 0:
         print("pytest retornou falha. Interrompendo execução de demais passos.")
         return rc
 
-    # Opcional: roda a simulação autônoma (modo --simulacao se suportado)
+    # Opcional: roda a simulação autônoma (modo simulação, sem API Flask)
     try:
-        subprocess.call([sys.executable, "main_autonomous.py", "--simulacao"])
+        from main_autonomous import executar_missao
+        executar_missao(usar_simulacao=True)
     except Exception:
         print("Não foi possível executar main_autonomous.py --simulacao (pode não existir ou requerer setup).")
 
     # Roda o benchmark
-    subprocess.call([sys.executable, "benchmark.py"]) 
+    import benchmark
+    benchmark.main(100)
     return 0
 
 
@@ -20,3 +20,44 @@ def test_actions_within_bounds():
     acoes2 = problem.actions(state2)
     assert "BAIXO" not in acoes2
     assert "DIREITA" not in acoes2
+
+
+def test_successors_equivalem_a_actions_e_result():
+    problem = PollutionMappingProblem(
+        initial=(1, 1, 10, ((0, 1), (2, 2))),
+        goal=(0, 0),
+        grid_size=(3, 3),
+        obstaculos={(1, 0)},
+        zonas_urbanas={(2, 1)},
+    )
+
+    state = problem.initial
+    esperado = [
+        (acao, problem.result(state, acao),
+         problem.path_cost(0, state, acao, problem.result(state, acao)))
+        for acao in problem.actions(state)
+    ]
+    assert problem.successors(state) == esperado
+    assert problem.successors((1, 1, 0, 0)) == []
+
+
+def test_movimento_para_fora_do_grid_custa_1():
+    # Todas as células são urbanas: só uma célula inexistente custa 1
+    celulas = {(x, y) for x in range(3) for y in range(3)}
+    problem = PollutionMappingProblem(
+        initial=(1, 1, 10, frozenset()),
+        goal=(0, 0),
+        grid_size=(3, 3),
+        zonas_urbanas=celulas,
+    )
+
+    casos = [
+        ((1, 0, 10, 0), "CIMA", (1, -1, 9, 0)),
+        ((2, 2, 10, 0), "BAIXO", (2, 3, 9, 0)),
+        ((0, 1, 10, 0), "ESQUERDA", (-1, 1, 9, 0)),
+        ((2, 2, 10, 0), "DIREITA", (3, 2, 9, 0)),
+    ]
+    for estado, acao, esperado in casos:
+        novo = problem.result(estado, acao)
+        assert novo == esperado
+        assert problem.path_cost(0, estado, acao, novo) == 1
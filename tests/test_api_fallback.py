@@ -1,3 +1,5 @@
+from collections.abc import Mapping, Sequence
+
 from drone_agents.api_gateway import APIGateway
 
 
@@ -5,8 +7,15 @@ def test_api_gateway_fallback_simulation_mode():
     gateway = APIGateway(usar_simulacao=True)
 
     chamados = gateway.get_all_chamados()
-    assert isinstance(chamados, list)
+    assert isinstance(chamados, Sequence)
     assert len(chamados) >= 1
+    assert all(isinstance(c, Mapping) for c in chamados)
+    # Sem cópia por chamada: a mesma tupla é devolvida
+    assert gateway.get_all_chamados() is chamados
+
+    copias = gateway.get_all_chamados(copiar=True)
+    assert isinstance(copias, list)
+    assert all(type(c) is dict for c in copias)
 
     # Atualiza um chamado simulado e verifica retorno
     primeiro_id = chamados[0]["id"]
@@ -18,3 +27,13 @@ def test_api_gateway_fallback_simulation_mode():
     for c in novos:
         if c["id"] == primeiro_id:
             assert c["status"] == "fechado"
+
+
+def test_api_gateway_silencioso_nao_imprime(capsys):
+    gateway = APIGateway(usar_simulacao=True, verbose=False)
+
+    chamado_id = gateway.get_all_chamados()[0]["id"]
+    assert gateway.update_chamado_status(chamado_id, "em_andamento") is True
+    assert gateway.batch_update_chamado_status([(chamado_id, "fechado", None)])
+
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from problems.astar_numba import (
+    ACOES,
+    MAX_ESTADOS_COMPILADO,
+    a_star_alvos,
+    a_star_numba,
+    a_star_rota,
+)
+from problems.search_problem import construir_grid
+
+
+def test_astar_numba_custo_com_urban_penalty():
+    grid = construir_grid((3, 3), obstaculos={(1, 1)}, zonas_urbanas={(1, 0)})
+
+    # Ida e volta até (2,0) pela zona urbana custa 2×(3+1)=8;
+    # contornar o obstáculo do centro custaria 6 em cada trecho
+    custo, passos, nos = a_star_numba(grid, 0, 0, 20, 2, 0)
+    assert custo == 8
+    assert passos == 4
+    assert nos > 0
+
+
+def test_astar_numba_sem_bateria_suficiente():
+    grid = construir_grid((3, 3))
+
+    custo, passos, _ = a_star_numba(grid, 0, 0, 3, 2, 2)
+    assert custo == -1
+    assert passos == -1
+
+
+def test_astar_rota_devolve_plano():
+    grid = construir_grid((3, 3), obstaculos={(1, 1)}, zonas_urbanas={(1, 0)})
+
+    custo, codigos = a_star_rota(grid, 0, 0, 20, 2, 0)
+    assert custo == 4
+    assert [ACOES[c] for c in codigos] == ["DIREITA", "DIREITA"]
+
+    custo, codigos = a_star_rota(grid, 0, 0, 3, 2, 0)
+    assert custo == -1
+    assert len(codigos) == 0
+
+
+def test_astar_alvos_recusa_espaco_de_estados_grande():
+    # 12 alvos cabem num grid 10×10, mas não num 100×100 (~41 mi de estados).
+    grid = construir_grid((100, 100))
+    n = 12
+    alvos_x = np.arange(n, dtype=np.int64)
+    alvos_y = np.arange(n, dtype=np.int64)
+
+    with pytest.raises(ValueError, match=str(MAX_ESTADOS_COMPILADO)):
+        a_star_alvos(grid, 0, 0, 100, alvos_x, alvos_y, (1 << n) - 1, 0, 0)
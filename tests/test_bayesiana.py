@@ -0,0 +1,68 @@
+import numpy as np
+
+from bayesian.diagnostico_poluicao import (
+    CPT_MARE,
+    CPT_POLUICAO_GRAVE,
+    CPT_PROXIMIDADE_URBANA,
+    CPT_SAUDE_MANGUE,
+    INDICE_PROXIMIDADE,
+    INDICE_SAUDE,
+    RedeBayesianaPoluicao,
+)
+
+
+def enumerar(evidencias):
+    # Enumeração direta sobre as CPTs, como referência para a rede
+    num = den = 0.0
+    for mare, p_mare in CPT_MARE.items():
+        if evidencias.get("mare", mare) != mare:
+            continue
+        for prox, p_prox in CPT_PROXIMIDADE_URBANA.items():
+            if evidencias.get("proximidade_urbana", prox) != prox:
+                continue
+            for saude, p_saude in CPT_SAUDE_MANGUE[(mare, prox)].items():
+                if evidencias.get("saude_mangue", saude) != saude:
+                    continue
+                p = p_mare * p_prox * p_saude
+                num += p * CPT_POLUICAO_GRAVE[(saude, prox)]["sim"]
+                den += p
+    return num / den
+
+
+def test_inferir_igual_enumeracao():
+    rede = RedeBayesianaPoluicao()
+    casos = [
+        {},
+        {"mare": "alta"},
+        {"mare": "baixa", "proximidade_urbana": "sim"},
+        {"proximidade_urbana": "sim", "saude_mangue": "degradada"},
+        {"mare": "alta", "proximidade_urbana": "não", "saude_mangue": "boa"},
+    ]
+    for evidencias in casos:
+        assert abs(rede.inferir(evidencias) - enumerar(evidencias)) < 1e-12
+
+
+def test_classificar_risco_em_lote_igual_escalar():
+    rede = RedeBayesianaPoluicao()
+    probs = [0.0, 0.2499, 0.25, 0.49, 0.5, 0.74, 0.75, 1.0]
+    lote = rede.classificar_risco_em_lote(np.array(probs))
+    assert list(lote) == [rede.classificar_risco(p) for p in probs]
+
+
+def test_converter_leituras_em_lote_igual_escalar():
+    rede = RedeBayesianaPoluicao()
+    leituras = [
+        {"OD": 3.0, "mercurio": 0.0, "chumbo": 0.0},
+        {"OD": 5.0, "mercurio": 0.002, "chumbo": 0.0},
+        {"OD": 6.0, "mercurio": 0.0, "chumbo": 0.02},
+        {"OD": 7.5, "mercurio": 0.0, "chumbo": 0.0},
+    ]
+    urbana = np.array([False, False, False, True])
+    lote = rede.converter_leituras_em_lote(
+        np.array([[l["OD"], l["mercurio"], l["chumbo"]] for l in leituras]), urbana
+    )
+    for leitura, u, registro in zip(leituras, urbana, lote):
+        esperado = rede.converter_leitura_sensor(leitura, bool(u))
+        assert registro["proximidade"] == INDICE_PROXIMIDADE[esperado["proximidade_urbana"]]
+        saude = esperado.get("saude_mangue")
+        assert registro["saude"] == (INDICE_SAUDE[saude] if saude else -1)
@@ -0,0 +1,132 @@
+import gc
+
+from drone_agents import drone_agent
+from drone_agents.drone_agent import AutonomousDroneAgent
+
+
+class GatewayHTTPFalso:
+    """Gateway fora do modo simulado: atualizações passam pela fila em lote."""
+
+    usar_simulacao = False
+
+    def __init__(self, chamados=None):
+        self.lotes = []
+        self.chamados = chamados or [{"id": 7, "titulo": "Ponto único", "coord": (0, 1)}]
+
+    def get_open_chamados(self):
+        return list(self.chamados)
+
+    def get_chamado_coordinates(self, chamado):
+        return chamado["coord"]
+
+    def batch_update_chamado_status(self, lote):
+        self.lotes.append(list(lote))
+        return True
+
+
+def _status_enviados(gateway):
+    return [(cid, status) for lote in gateway.lotes for cid, status, _ in lote]
+
+
+def test_fim_da_missao_despacha_atualizacoes_sem_finalize():
+    gateway = GatewayHTTPFalso()
+    agente = AutonomousDroneAgent(gateway, grid_size=(3, 3), verbose=False)
+
+    agente.formulate_goal(agente.update_state(None, {"location": (0, 0)}))
+    agente.update_state(None, {"location": (0, 1)})
+    estado = agente.update_state(None, {"location": (0, 0)})
+    assert agente.formulate_goal(estado) is None
+
+    assert _status_enviados(gateway) == [(7, "em_andamento"), (7, "fechado")]
+
+
+def test_agente_coletado_despacha_fila_pendente():
+    gateway = GatewayHTTPFalso()
+    agente = AutonomousDroneAgent(gateway, grid_size=(3, 3), verbose=False)
+    agente._status_queue.append((7, "fechado", None))
+
+    del agente
+    gc.collect()
+
+    assert (7, "fechado") in _status_enviados(gateway)
+
+
+def test_alvo_inalcancavel_retorna_a_base_pela_busca_que_falhou():
+    # (4, 4) fica isolado pelos obstáculos; a base continua alcançável.
+    gateway = GatewayHTTPFalso([{"id": 1, "titulo": "Isolado", "coord": (4, 4)}])
+    agente = AutonomousDroneAgent(
+        gateway,
+        grid_size=(5, 5),
+        obstaculos={(3, 4), (4, 3)},
+        zonas_urbanas={(2, 2)},
+        battery_capacity=30,
+        verbose=False,
+    )
+
+    estado = agente.update_state(None, {"location": (2, 0), "battery": 30})
+    objetivo = agente.formulate_goal(estado)
+    assert objetivo == (4, 4)
+
+    plano = agente.search(agente.formulate_problem(estado, objetivo))
+    assert plano == ["ESQUERDA", "ESQUERDA"]
+    assert agente._returning_to_base
+    assert not agente._targets
+    agente.finalize()
+
+
+def test_remover_pendente_com_dois_chamados_na_mesma_coordenada():
+    gateway = GatewayHTTPFalso([
+        {"id": 1, "titulo": "A", "coord": (1, 1)},
+        {"id": 2, "titulo": "B", "coord": (2, 2)},
+        {"id": 3, "titulo": "C", "coord": (1, 1)},
+        {"id": 4, "titulo": "D", "coord": (0, 2)},
+    ])
+    agente = AutonomousDroneAgent(gateway, grid_size=(3, 3), verbose=False)
+
+    def ids_pendentes():
+        return [c["id"] for c in agente._pending_chamados]
+
+    def indices_consistentes():
+        for coord, indices in agente._indices_por_coord.items():
+            for i in indices:
+                chamado = agente._pending_chamados[i]
+                assert agente._chamado_coord[chamado["id"]] == coord
+        total = sum(len(indices) for indices in agente._indices_por_coord.values())
+        assert total == len(agente._pending_chamados)
+
+    # O mais antigo da coordenada sai primeiro; o último da lista ocupa a vaga
+    assert agente._remover_pendente((1, 1))["id"] == 1
+    assert ids_pendentes() == [4, 2, 3]
+    indices_consistentes()
+
+    assert agente._remover_pendente((1, 1))["id"] == 3
+    assert ids_pendentes() == [4, 2]
+    assert agente._remover_pendente((1, 1)) is None
+
+    assert agente._remover_pendente((0, 2))["id"] == 4
+    assert ids_pendentes() == [2]
+    indices_consistentes()
+
+
+def test_plano_repetido_vem_do_cache(monkeypatch):
+    gateway = GatewayHTTPFalso([{"id": 1, "titulo": "A", "coord": (2, 0)}])
+    agente = AutonomousDroneAgent(gateway, grid_size=(3, 3), verbose=False)
+
+    estado = agente.update_state(None, {"location": (0, 0)})
+    objetivo = agente.formulate_goal(estado)
+    problema = agente.formulate_problem(estado, objetivo)
+    plano = agente.search(problema)
+    assert plano == ["DIREITA", "DIREITA", "COLETAR"]
+
+    def sem_busca(*args):
+        raise AssertionError("o plano deveria vir do cache")
+
+    monkeypatch.setattr(drone_agent, "buscar_rota", sem_busca)
+    monkeypatch.setattr(drone_agent, "jps_rota", sem_busca)
+
+    repetido = agente.search(problema)
+    assert repetido == plano
+    # Quem recebe o plano pode consumi-lo sem alterar o cache
+    repetido.clear()
+    assert agente.search(problema) == plano
+    agente.finalize()
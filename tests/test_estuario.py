@@ -0,0 +1,86 @@
+from agents import Agent
+
+from env.estuario import MangroveObstacle, PoximEnvironment, PollutionSample
+
+
+def test_indices_de_amostras_e_obstaculos():
+    env = PoximEnvironment(width=3, height=3)
+    agente = Agent(lambda percept: None)
+    env.add_agent_at(agente, (0, 0))
+    amostra = PollutionSample(chamado_id=1)
+    env.add_thing(amostra, (1, 0))
+    obstaculo = MangroveObstacle()
+    env.add_thing(obstaculo, (0, 1))
+
+    # Obstáculo bloqueia o movimento
+    env.execute_action(agente, "BAIXO")
+    assert agente.location == (0, 0)
+
+    # Amostra pendente impede o fim da missão até ser coletada
+    env.execute_action(agente, "DIREITA")
+    assert not env.is_done()
+    env.execute_action(agente, "COLETAR")
+    env.execute_action(agente, "ESQUERDA")
+    assert amostra.coletado
+    assert env.is_done()
+
+    # Removido o obstáculo, a célula fica livre
+    env.delete_thing(obstaculo)
+    env.execute_action(agente, "BAIXO")
+    assert agente.location == (0, 1)
+
+
+def test_modo_silencioso_registra_movimentos(capsys):
+    env = PoximEnvironment(
+        width=3, height=3, zonas_urbanas={(1, 0)}, verbose=False, record=True
+    )
+    agente = Agent(lambda percept: None)
+    env.add_agent_at(agente, (0, 0))
+
+    env.execute_action(agente, "DIREITA")
+    env.execute_action(agente, "CIMA")
+
+    assert capsys.readouterr().out == ""
+    assert env.get_log() == [(0, "DIREITA", (1, 0), 3)]
+
+
+def test_plan_path_desvia_de_obstaculo_e_zona_urbana():
+    env = PoximEnvironment(width=3, height=3, zonas_urbanas={(1, 1)})
+    env.add_thing(MangroveObstacle(), (1, 0))
+
+    plano = env.plan_path((0, 0), (2, 0))
+
+    # Contornar por (1, 1) ou pela linha de baixo custa o mesmo: 6
+    agente = Agent(lambda percept: None)
+    env.add_agent_at(agente, (0, 0))
+    for acao in plano:
+        env.execute_action(agente, acao)
+    assert agente.location == (2, 0)
+    assert env.get_battery(agente) == env.battery_capacity - 6
+    env.add_thing(MangroveObstacle(), (1, 2))
+    env.add_thing(MangroveObstacle(), (1, 1))
+    assert env.plan_path((0, 0), (2, 0)) is None
+
+
+def test_plan_path_recusa_origem_ou_destino_invalidos():
+    env = PoximEnvironment(width=3, height=3)
+    env.add_thing(MangroveObstacle(), (1, 1))
+
+    assert env.plan_path((-1, 0), (2, 2)) is None
+    assert env.plan_path((0, 0), (3, 0)) is None
+    assert env.plan_path((1, 1), (2, 2)) is None
+    assert env.plan_path((0, 0), (1, 1)) is None
+    assert env.plan_path((0, 0), (0, 0)) == []
+
+
+def test_remover_agente_descarta_bateria_e_amostras():
+    env = PoximEnvironment(width=2, height=1, battery_capacity=5)
+    agente = Agent(lambda percept: None)
+    env.add_agent_at(agente, (0, 0))
+    env.execute_action(agente, "DIREITA")
+
+    env.delete_thing(agente)
+
+    assert id(agente) not in env._agent_batteries
+    assert id(agente) not in env._agent_samples
+    assert env.get_battery(agente) == env.battery_capacity
@@ -23,3 +23,16 @@ def test_goal_conditions():
     # Estado com bateria negativa → não é objetivo
     state_low_battery = (0, 0, -1, frozenset())
     assert not problem.goal_test(state_low_battery)
+
+
+def test_alvos_em_tupla_equivalem_a_frozenset():
+    alvos = ((1, 2), (2, 0))
+    com_tupla = PollutionMappingProblem(
+        initial=(0, 0, 10, alvos), goal=(0, 0), grid_size=(3, 3)
+    )
+    com_frozenset = PollutionMappingProblem(
+        initial=(0, 0, 10, frozenset(alvos)), goal=(0, 0), grid_size=(3, 3)
+    )
+
+    assert com_tupla.initial == com_frozenset.initial
+    assert com_tupla.alvos == com_frozenset.alvos
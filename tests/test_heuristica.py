@@ -56,7 +56,8 @@ def test_h_nao_superestima():
     )
 
     state = (0, 0, 10, frozenset({(2, 0)}))
-    node = SimpleNode(state)
+    # O problema codifica os alvos do estado inicial como máscara de bits
+    node = SimpleNode(problem.initial)
 
     h_value = problem.h(node)
     real_cost = simulate_cost_to_goal(problem, state)
@@ -0,0 +1,29 @@
+from problems.astar_numba import a_star_rota
+from problems.jps import jps_rota
+from problems.search_problem import construir_grid
+
+
+def test_jps_mesmo_custo_que_astar():
+    obstaculos = {(2, 0), (2, 1), (2, 2), (2, 3), (5, 6), (5, 5), (6, 5)}
+    grid = construir_grid((8, 8), obstaculos=obstaculos)
+
+    acoes = jps_rota(grid, 0, 0, 50, 7, 7)
+    custo, _ = a_star_rota(grid, 0, 0, 50, 7, 7)
+    assert acoes is not None
+    assert len(acoes) == custo
+
+    # O plano subdividido percorre só células livres e termina no destino
+    deslocamento = {"CIMA": (0, -1), "BAIXO": (0, 1), "ESQUERDA": (-1, 0), "DIREITA": (1, 0)}
+    x, y = 0, 0
+    for acao in acoes:
+        dx, dy = deslocamento[acao]
+        x, y = x + dx, y + dy
+        assert (x, y) not in obstaculos
+    assert (x, y) == (7, 7)
+
+
+def test_jps_sem_bateria_suficiente():
+    grid = construir_grid((5, 5))
+
+    assert jps_rota(grid, 0, 0, 7, 4, 4) is None
+    assert jps_rota(grid, 0, 0, 8, 4, 4) is not None
@@ -0,0 +1,88 @@
+from search import astar_search
+
+from problems.search_problem import PollutionMappingProblem
+from problems.solver import astar_bucket, astar_compilado, astar_grid
+
+
+def test_astar_grid_igual_aima():
+    alvos = [(4, 1), (1, 4)]
+    problem = PollutionMappingProblem(
+        initial=(0, 0, 40, frozenset(alvos)),
+        goal=(0, 0),
+        grid_size=(6, 6),
+        obstaculos={(2, 0), (2, 1), (3, 3)},
+        zonas_urbanas={(1, 1), (4, 2), (1, 3)},
+        alvos=alvos,
+    )
+
+    referencia = astar_search(problem)
+    acoes, custo, nos = astar_grid(problem)
+    assert custo == referencia.path_cost
+    assert nos > 0
+
+    # Reaplicar as ações no problema chega a um estado objetivo
+    estado = problem.initial
+    for acao in acoes:
+        assert acao in problem.actions(estado)
+        estado = problem.result(estado, acao)
+    assert problem.goal_test(estado)
+
+
+def test_astar_grid_sem_bateria():
+    problem = PollutionMappingProblem(
+        initial=(0, 0, 5, frozenset({(3, 3)})), goal=(0, 0), grid_size=(4, 4)
+    )
+
+    acoes, custo, _ = astar_grid(problem)
+    assert acoes is None
+    assert custo == -1
+
+
+def test_astar_compilado_igual_astar_grid():
+    alvos = [(4, 1), (1, 4), (5, 5)]
+    problem = PollutionMappingProblem(
+        initial=(0, 0, 60, frozenset(alvos)),
+        goal=(0, 0),
+        grid_size=(6, 6),
+        obstaculos={(2, 0), (2, 1), (3, 3)},
+        zonas_urbanas={(1, 1), (4, 2), (1, 3)},
+        alvos=alvos,
+    )
+
+    _, custo_grid, _ = astar_grid(problem)
+    acoes, custo, _ = astar_compilado(problem)
+    assert custo == custo_grid
+
+    estado = problem.initial
+    for acao in acoes:
+        estado = problem.result(estado, acao)
+    assert problem.goal_test(estado)
+
+    sem_bateria = PollutionMappingProblem(
+        initial=(0, 0, 5, frozenset({(3, 3)})), goal=(0, 0), grid_size=(4, 4)
+    )
+    acoes, custo, _ = astar_compilado(sem_bateria)
+    assert acoes is None
+    assert custo == -1
+
+
+def test_astar_bucket_igual_astar_grid():
+    alvos = [(4, 1), (1, 4)]
+    problem = PollutionMappingProblem(
+        initial=(0, 0, 40, frozenset(alvos)),
+        goal=(0, 0),
+        grid_size=(6, 6),
+        obstaculos={(2, 0), (2, 1), (3, 3)},
+        zonas_urbanas={(1, 1), (4, 2), (1, 3)},
+        vento_atlantico="nenhum",
+        alvos=alvos,
+    )
+
+    # Mesma ordem de desempate (maior g): mesmo plano e mesmos nós expandidos
+    assert astar_bucket(problem) == astar_grid(problem)
+    acoes, _, _ = astar_bucket(problem)
+
+    estado = problem.initial
+    for acao in acoes:
+        estado = problem.result(estado, acao)
+    assert problem.goal_test(estado)
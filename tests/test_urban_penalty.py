@@ -21,3 +21,20 @@ def test_urban_penalty_consumption():
     env.execute_action(agent, "DIREITA")
 
     assert env.get_battery(agent) == env.battery_capacity - 3
+
+
+def test_custo_por_celula():
+    env = PoximEnvironment(width=3, height=2, zonas_urbanas={(2, 1)})
+
+    assert env.get_move_cost((2, 1)) == 3
+    assert env.get_move_cost((0, 0)) == 1
+    assert env._cost_grid.shape == (3, 2)
+    assert env._cost_grid[2, 1] == 3
+
+
+def test_h_to_base_soma_custos_de_entrada():
+    env = PoximEnvironment(width=3, height=1, zonas_urbanas={(1, 0)}, base_position=(0, 0))
+
+    # De (2,0) até a base: entra em (1,0) urbana (3) e em (0,0) (1)
+    assert env.h_to_base((2, 0)) == 4
+    assert env.h_to_base((0, 0)) == 0